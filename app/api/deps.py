@@ -7,8 +7,10 @@ FastAPIの依存注入機能を使用して、認証・DB接続などの共通
 import time
 from typing import Dict, Generator, Optional, Tuple
 
+import httpx
 from fastapi import Depends, HTTPException, Header, status
 from supabase import create_client, Client
+from supabase.lib.client_options import SyncClientOptions
 
 from app.core.config import settings
 from app.core.security import (
@@ -27,6 +29,41 @@ _ACTIVE_FLAG_TTL_SECONDS = 60
 _supabase_client: Optional[Client] = None
 _supabase_admin: Optional[Client] = None
 
+# Supabase向けHTTP接続プール設定。httpxのデフォルト（アイドル5秒で切断）では
+# リクエスト間隔が空くたびにTCP+TLSハンドシェイクが発生するため、長めに保持する。
+_HTTP_POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=60.0,
+)
+_HTTP_TIMEOUT_SECONDS = 120.0
+
+
+def _create_supabase_client(key: str) -> Client:
+    """
+    接続プールを共有するSupabaseクライアントを生成する
+
+    PostgREST・Auth・Storageの各サブクライアントが同じhttpx.Clientを使い、
+    HTTP/2 keep-alive接続を再利用する。
+
+    Args:
+        key: Supabase APIキー（匿名キーまたはサービスロールキー）
+
+    Returns:
+        Client: Supabaseクライアントインスタンス
+    """
+    http_client = httpx.Client(
+        http2=True,
+        limits=_HTTP_POOL_LIMITS,
+        timeout=_HTTP_TIMEOUT_SECONDS,
+        follow_redirects=True,
+    )
+    return create_client(
+        settings.SUPABASE_URL,
+        key,
+        options=SyncClientOptions(httpx_client=http_client),
+    )
+
 
 def get_supabase_client() -> Client:
     """
@@ -41,10 +78,7 @@ def get_supabase_client() -> Client:
     """
     global _supabase_client
     if _supabase_client is None:
-        _supabase_client = create_client(
-            settings.SUPABASE_URL,
-            settings.SUPABASE_ANON_KEY
-        )
+        _supabase_client = _create_supabase_client(settings.SUPABASE_ANON_KEY)
     return _supabase_client
 
 
@@ -64,10 +98,7 @@ def get_supabase_admin() -> Client:
     """
     global _supabase_admin
     if _supabase_admin is None:
-        _supabase_admin = create_client(
-            settings.SUPABASE_URL,
-            settings.SUPABASE_SERVICE_ROLE_KEY
-        )
+        _supabase_admin = _create_supabase_client(settings.SUPABASE_SERVICE_ROLE_KEY)
     return _supabase_admin
 
 
@@ -137,7 +168,7 @@ async def get_current_user(
         token = extract_token_from_header(authorization)
 
         # トークンを検証してユーザー情報を取得
-        user_info = verify_token(token)
+        user_info = await verify_token(token)
 
         # 無効化されたアカウントはアクセス拒否
         if not _is_user_active(user_info.get("user_id")):
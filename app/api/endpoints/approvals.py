@@ -5,6 +5,7 @@
 閲覧/起票は user_page_permissions の "approvals" キーで制御（管理者・役員は常に許可）。
 承認アクションの可否は「自分が現在の承認担当か」で service 層が判定する。
 """
+from typing import Dict, List
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
@@ -73,6 +74,7 @@ async def pending_count(
 
 @router.get(
     "/assignable-users",
+    response_model=List[Dict[str, str]],
     summary="承認者候補一覧（承認者指定UIに使う軽量ユーザー一覧）",
 )
 async def assignable_users(
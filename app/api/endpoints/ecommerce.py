@@ -18,6 +18,7 @@ from app.api.deps import get_current_user, get_supabase_admin
 from app.schemas.kpi import User
 from app.schemas.ecommerce import (
     ChannelSummaryResponse,
+    ProductData,
     ProductSummaryResponse,
     CustomerSummaryResponse,
     WebsiteStatsResponse,
@@ -450,9 +451,16 @@ async def upload_ecommerce_data(
         # Excelの場合
         else:
             import openpyxl
-            wb = openpyxl.load_workbook(io.BytesIO(content))
-            ws = wb.active
-            rows = list(ws.iter_rows(values_only=True))
+            # 先頭から順に読むだけなのでread_onlyモードでストリーミング読み込みする
+            wb = openpyxl.load_workbook(io.BytesIO(content), read_only=True)
+            try:
+                ws = wb.active
+                # 外部ツールで作られたファイルは<dimension>が不正確なことがあり、
+                # read_onlyモードでは行・列が欠けるため実データから範囲を求め直す
+                ws.reset_dimensions()
+                rows = list(ws.iter_rows(values_only=True))
+            finally:
+                wb.close()
             if not rows:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
@@ -826,7 +834,11 @@ async def product_summary(
 
     try:
         result = await get_product_summary(supabase, month, period_type, limit)
-        return ProductSummaryResponse(**result)
+        # 商品数×項目数の検証を避けるため、型変換済みの値から検証なしで生成する
+        return ProductSummaryResponse.model_construct(**{
+            **result,
+            "products": [ProductData.model_construct(**p) for p in result["products"]],
+        })
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -7,7 +7,9 @@ KPIデータの取得・計算を行うエンドポイントを提供する。
 from datetime import date
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, Query, HTTPException, status
+from fastapi import APIRouter, Depends, Query, HTTPException, Response, status
+from pydantic import TypeAdapter
+from pydantic_core import to_json
 from supabase import Client
 
 from app.api.deps import get_current_user, get_supabase_admin
@@ -22,6 +24,8 @@ from app.schemas.kpi import (
     ChartData,
     RankingItem,
     AlertItem,
+    ProductValue,
+    StoreProductData,
     ProductMatrixResponse,
     ProductTrendResponse,
     TargetValueCreate,
@@ -29,6 +33,9 @@ from app.schemas.kpi import (
     TargetValueBulkCreate,
     TargetValueResponse,
     TargetValueBulkResponse,
+    TargetMatrixCell,
+    TargetMatrixKPI,
+    TargetMatrixRow,
     TargetMatrixResponse,
     StoreDetailResponse,
 )
@@ -54,6 +61,11 @@ from app.services.target_service import (
 # ルーター作成
 router = APIRouter(tags=["KPI"])
 
+# サービス層が返すdictのリストを1回の検証でモデルのリストに変換する
+_RANKING_LIST_ADAPTER = TypeAdapter(List[RankingItem])
+_ALERT_LIST_ADAPTER = TypeAdapter(List[AlertItem])
+_TARGET_VALUE_LIST_ADAPTER = TypeAdapter(List[TargetValueResponse])
+
 
 # =============================================================================
 # 部門関連エンドポイント
@@ -381,7 +393,7 @@ async def get_segment_ranking(
     target_month = month if month else date.today()
 
     result = await get_ranking(supabase, department_id, target_month, kpi_name, limit)
-    return [RankingItem(**item) for item in result]
+    return _RANKING_LIST_ADAPTER.validate_python(result)
 
 
 # =============================================================================
@@ -426,7 +438,7 @@ async def get_alert_list(
     target_month = month if month else date.today()
 
     result = await get_alerts(supabase, department_id, target_month)
-    return [AlertItem(**item) for item in result]
+    return _ALERT_LIST_ADAPTER.validate_python(result)
 
 
 # =============================================================================
@@ -537,7 +549,24 @@ async def get_product_matrix_data(
     target_month = month if month else date.today()
 
     result = await get_product_matrix(supabase, department_id, target_month, period_type)
-    return ProductMatrixResponse(**result)
+    # 店舗数×商品グループ数の検証を避けるため、型変換済みの値から検証なしで生成する
+    return ProductMatrixResponse.model_construct(**{
+        **result,
+        "stores": [
+            StoreProductData.model_construct(**{
+                **store,
+                "products": {
+                    name: ProductValue.model_construct(**value)
+                    for name, value in store["products"].items()
+                },
+            })
+            for store in result["stores"]
+        ],
+        "totals": {
+            name: ProductValue.model_construct(**value)
+            for name, value in result["totals"].items()
+        },
+    })
 
 
 # =============================================================================
@@ -619,7 +648,7 @@ async def get_kpi_values(
     is_target: Optional[bool] = Query(None, description="目標値(true)か実績値(false)か"),
     current_user: User = Depends(get_current_user),
     supabase: Client = Depends(get_supabase_admin),
-) -> List[KPIValueResponse]:
+) -> Response:
     """
     KPI値を取得する
 
@@ -631,7 +660,7 @@ async def get_kpi_values(
         is_target: 目標値/実績値フィルタ（オプション）
 
     Returns:
-        List[KPIValueResponse]: KPI値一覧
+        Response: KPI値一覧（List[KPIValueResponse]形式のJSON）
     """
     query = supabase.table("kpi_values").select(
         "id, segment_id, kpi_id, date, value, is_target"
@@ -650,17 +679,22 @@ async def get_kpi_values(
 
     response = query.order("date", desc=True).execute()
 
-    return [
-        KPIValueResponse(
-            id=v["id"],
-            segment_id=v["segment_id"],
-            kpi_id=v["kpi_id"],
-            date=v["date"],
-            value=float(v["value"]),
-            is_target=v["is_target"]
-        )
-        for v in response.data
-    ]
+    # 年度分の時系列では数千行になるため、モデルを生成せず行から直接JSONにする
+    # （dateはDBの "YYYY-MM-DD" 文字列のまま。キー順はKPIValueResponseと同じ）
+    return Response(
+        content=to_json([
+            {
+                "id": v["id"],
+                "segment_id": v["segment_id"],
+                "kpi_id": v["kpi_id"],
+                "date": v["date"],
+                "value": float(v["value"]),
+                "is_target": v["is_target"],
+            }
+            for v in response.data
+        ]),
+        media_type="application/json",
+    )
 
 
 # =============================================================================
@@ -874,7 +908,7 @@ async def list_targets(
     result = await get_target_values(
         supabase, department_id, month, segment_id, kpi_id
     )
-    return [TargetValueResponse(**item) for item in result]
+    return _TARGET_VALUE_LIST_ADAPTER.validate_python(result)
 
 
 @router.get(
@@ -919,4 +953,18 @@ async def get_targets_matrix(
     department_id = dept_response.data["id"]
 
     result = await get_target_matrix(supabase, department_id, month)
-    return TargetMatrixResponse(**result)
+    # 店舗数×KPI数の検証を避けるため、型変換済みの値から検証なしで生成する
+    return TargetMatrixResponse.model_construct(**{
+        **result,
+        "kpis": [TargetMatrixKPI.model_construct(**kpi) for kpi in result["kpis"]],
+        "rows": [
+            TargetMatrixRow.model_construct(**{
+                **row,
+                "values": {
+                    kpi_id: TargetMatrixCell.model_construct(**cell)
+                    for kpi_id, cell in row["values"].items()
+                },
+            })
+            for row in result["rows"]
+        ],
+    })
@@ -6,7 +6,7 @@
 from fastapi import APIRouter, Depends, Query
 
 from app.api.deps import get_current_user
-from app.schemas.news import NewsItem, NewsResponse
+from app.schemas.news import NewsResponse
 from app.services import news_service
 
 router = APIRouter()
@@ -27,4 +27,4 @@ async def get_gyoza_news(
     取得失敗時は空の一覧を返す（ダッシュボードを壊さない）。
     """
     items = await news_service.get_gyoza_news(limit=limit)
-    return NewsResponse(items=[NewsItem(**item) for item in items])
+    return NewsResponse(items=items)
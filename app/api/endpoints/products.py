@@ -13,9 +13,13 @@ from supabase import Client
 from app.api.deps import get_current_user, get_supabase_admin
 from app.schemas.kpi import (
     User,
+    StoreSummaryItem,
+    StoreSummaryTotals,
     StoreSummaryResponse,
     AvailableMonthsResponse,
+    StoreTrendItem,
     StoreTrendAllResponse,
+    StoreTrendSummary,
     StoreTrendSingleResponse,
 )
 from app.services.kpi_service import (
@@ -83,7 +87,12 @@ async def store_summary(
             target_month=month,
             period_type=period_type
         )
-        return StoreSummaryResponse(**result)
+        # 店舗数×項目数の検証を避けるため、型変換済みの値から検証なしで生成する
+        return StoreSummaryResponse.model_construct(**{
+            **result,
+            "stores": [StoreSummaryItem.model_construct(**s) for s in result["stores"]],
+            "totals": StoreSummaryTotals.model_construct(**result["totals"]),
+        })
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -179,7 +188,11 @@ async def store_trend_all(
             department_id=department_id,
             fiscal_year=fiscal_year
         )
-        return StoreTrendAllResponse(**result)
+        # 型変換済みの値から検証なしで生成する
+        return StoreTrendAllResponse.model_construct(**{
+            **result,
+            "stores": [StoreTrendItem.model_construct(**s) for s in result["stores"]],
+        })
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -229,7 +242,11 @@ async def store_trend_single(
             segment_id=segment_id,
             fiscal_year=fiscal_year
         )
-        return StoreTrendSingleResponse(**result)
+        # 型変換済みの値から検証なしで生成する
+        return StoreTrendSingleResponse.model_construct(**{
+            **result,
+            "summary": StoreTrendSummary.model_construct(**result["summary"]),
+        })
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
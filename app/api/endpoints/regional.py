@@ -12,7 +12,6 @@ from supabase import Client
 from app.api.deps import get_current_user, get_supabase_admin
 from app.schemas.kpi import User
 from app.schemas.regional import (
-    Region,
     RegionListResponse,
     StoreRegionMappingListResponse,
     UpdateStoreRegionRequest,
@@ -56,9 +55,7 @@ async def list_regions(
     """
     try:
         regions = await get_regions(supabase)
-        return RegionListResponse(
-            regions=[Region(**r) for r in regions]
-        )
+        return RegionListResponse(regions=regions)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -74,7 +74,7 @@ async def get_store_targets(
             raise HTTPException(status_code=404, detail="店舗部門が見つかりません")
 
         department_id = dept_response.data[0]["id"]
-        return await target_service.get_target_matrix(supabase, department_id, month)
+        return await target_service.get_store_target_matrix(supabase, department_id, month)
     except HTTPException:
         raise
     except Exception as e:
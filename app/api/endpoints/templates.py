@@ -5,18 +5,22 @@
 """
 import calendar
 import io
+import zipfile
 from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response
 from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
+from openpyxl.styles import Font, Alignment, PatternFill, Border, Side, NamedStyle
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.utils import get_column_letter
 from supabase import Client
 
 from app.api.deps import get_supabase_admin
+from app.services.import_service import get_department_id_by_slug
 
 
 router = APIRouter(prefix="/templates", tags=["templates"])
@@ -32,32 +36,74 @@ THIN_BORDER = Border(
     bottom=Side(style="thin"),
 )
 
+# 名前付きスタイル名（ワークブックごとに登録して使い回す）
+BORDERED_STYLE = "bordered"
+TOTAL_STYLE = "hdr_total"
 
-def generate_financial_template(year: int, month: int) -> io.BytesIO:
+
+def _register_named_styles(wb: Workbook) -> None:
     """
-    財務データ入力用Excelテンプレートを生成する（詳細版）
+    罫線・合計行用の名前付きスタイルをワークブックに登録する
+
+    セルごとにfont/fill/borderを個別に代入するより、
+    名前付きスタイルを1回の代入で適用する方が軽い。
 
     Args:
-        year: 対象年
-        month: 対象月
+        wb: 登録先のワークブック
+    """
+    wb.add_named_style(NamedStyle(name=BORDERED_STYLE, border=THIN_BORDER))
+    wb.add_named_style(
+        NamedStyle(name=TOTAL_STYLE, font=HEADER_FONT, fill=HEADER_FILL, border=THIN_BORDER)
+    )
+
+
+def _append_item_rows(ws, items: List[tuple]) -> None:
+    """
+    (項目名, 計算式, 単位, 見出しフラグ) のリストを1行ずつ追記する
+
+    write_onlyモードのシートに対して行単位でappendするため、
+    セルグリッドを経由せずに書き込める。
+
+    Args:
+        ws: 書き込み先のワークシート（write_only）
+        items: 項目定義のリスト
+    """
+    for item_name, formula, unit, is_section in items:
+        if is_section:
+            name_cell = WriteOnlyCell(ws, value=item_name)
+            name_cell.font = HEADER_FONT
+            name_cell.fill = HEADER_FILL
+            formula_cell = WriteOnlyCell(ws, value=formula)
+            formula_cell.fill = HEADER_FILL
+            unit_cell = WriteOnlyCell(ws, value=unit)
+            unit_cell.fill = HEADER_FILL
+            ws.append([name_cell, formula_cell, unit_cell])
+        else:
+            ws.append([item_name, formula, unit])
+
+
+def _build_financial_workbook(period: str) -> io.BytesIO:
+    """
+    財務データ入力用Excelテンプレートをopenpyxlで生成する（詳細版）
+
+    Args:
+        period: 各シートのB1に入れる対象年月（"YYYY/MM/01"）
 
     Returns:
         Excelファイルのバイトストリーム
     """
-    wb = Workbook()
+    wb = Workbook(write_only=True)
 
     # ========== シート1: 月次財務データ（基本） ==========
-    ws = wb.active
-    ws.title = "月次財務データ"
+    ws = wb.create_sheet("月次財務データ")
 
     ws.column_dimensions["A"].width = 25
     ws.column_dimensions["B"].width = 15
     ws.column_dimensions["C"].width = 8
 
-    ws["A1"] = "対象年月"
-    ws["B1"] = f"{year}/{month:02d}/01"
-    ws["A2"] = "データ区分"
-    ws["B2"] = "実績"
+    ws.append(["対象年月", period])
+    ws.append(["データ区分", "実績"])
+    ws.append([])
 
     # row=4から開始: B5=全社売上, B9=売上原価, B10=粗利, B13=販管費, B15=営業利益
     items = [
@@ -80,20 +126,7 @@ def generate_financial_template(year: int, month: int) -> io.BytesIO:
         ("財務キャッシュフロー", None, "円", False),              # row 20
         ("フリーキャッシュフロー", "=B18+B19", "円", False),     # row 21
     ]
-
-    row = 4
-    for item_name, formula, unit, is_section in items:
-        ws[f"A{row}"] = item_name
-        if formula:
-            ws[f"B{row}"] = formula
-        if unit:
-            ws[f"C{row}"] = unit
-        if is_section:
-            ws[f"A{row}"].font = HEADER_FONT
-            ws[f"A{row}"].fill = HEADER_FILL
-            ws[f"B{row}"].fill = HEADER_FILL
-            ws[f"C{row}"].fill = HEADER_FILL
-        row += 1
+    _append_item_rows(ws, items)
 
     # ========== シート2: 売上原価明細 ==========
     ws2 = wb.create_sheet("売上原価明細")
@@ -101,8 +134,8 @@ def generate_financial_template(year: int, month: int) -> io.BytesIO:
     ws2.column_dimensions["B"].width = 15
     ws2.column_dimensions["C"].width = 8
 
-    ws2["A1"] = "対象年月"
-    ws2["B1"] = f"{year}/{month:02d}/01"
+    ws2.append(["対象年月", period])
+    ws2.append([])
 
     # row=3から開始: B4=仕入高, B10=水道光熱費, B11=その他, B12=合計参照
     # シート1のB9=売上原価
@@ -118,20 +151,7 @@ def generate_financial_template(year: int, month: int) -> io.BytesIO:
         ("その他", "=月次財務データ!B9-SUM(B4:B10)", "円", False),         # row 11
         ("売上原価合計（参照）", "=月次財務データ!B9", "円", True),         # row 12
     ]
-
-    row = 3
-    for item_name, formula, unit, is_section in cost_items:
-        ws2[f"A{row}"] = item_name
-        if formula:
-            ws2[f"B{row}"] = formula
-        if unit:
-            ws2[f"C{row}"] = unit
-        if is_section:
-            ws2[f"A{row}"].font = HEADER_FONT
-            ws2[f"A{row}"].fill = HEADER_FILL
-            ws2[f"B{row}"].fill = HEADER_FILL
-            ws2[f"C{row}"].fill = HEADER_FILL
-        row += 1
+    _append_item_rows(ws2, cost_items)
 
     # ========== シート3: 販管費明細 ==========
     ws3 = wb.create_sheet("販管費明細")
@@ -139,8 +159,8 @@ def generate_financial_template(year: int, month: int) -> io.BytesIO:
     ws3.column_dimensions["B"].width = 15
     ws3.column_dimensions["C"].width = 8
 
-    ws3["A1"] = "対象年月"
-    ws3["B1"] = f"{year}/{month:02d}/01"
+    ws3.append(["対象年月", period])
+    ws3.append([])
 
     # row=3から開始: B4=役員報酬, B11=広告宣伝費, B12=その他, B13=合計参照
     # シート1のB13=販管費合計
@@ -157,20 +177,7 @@ def generate_financial_template(year: int, month: int) -> io.BytesIO:
         ("その他", "=月次財務データ!B13-SUM(B4:B11)", "円", False),        # row 12
         ("販管費合計（参照）", "=月次財務データ!B13", "円", True),          # row 13
     ]
-
-    row = 3
-    for item_name, formula, unit, is_section in sga_items:
-        ws3[f"A{row}"] = item_name
-        if formula:
-            ws3[f"B{row}"] = formula
-        if unit:
-            ws3[f"C{row}"] = unit
-        if is_section:
-            ws3[f"A{row}"].font = HEADER_FONT
-            ws3[f"A{row}"].fill = HEADER_FILL
-            ws3[f"B{row}"].fill = HEADER_FILL
-            ws3[f"C{row}"].fill = HEADER_FILL
-        row += 1
+    _append_item_rows(ws3, sga_items)
 
     output = io.BytesIO()
     wb.save(output)
@@ -178,6 +185,48 @@ def generate_financial_template(year: int, month: int) -> io.BytesIO:
     return output
 
 
+# 財務テンプレートで年月によって変わるのは対象年月の文字列のみのため、
+# プレースホルダー入りのxlsxを一度だけ生成し、リクエストごとに置換する
+FINANCIAL_PERIOD_PLACEHOLDER = "__PERIOD__"
+
+
+@lru_cache(maxsize=1)
+def _financial_template_parts() -> Tuple[Tuple[zipfile.ZipInfo, bytes], ...]:
+    """
+    プレースホルダー入り財務テンプレートのZIPエントリ一覧を返す（初回のみ生成）
+
+    Returns:
+        (ZipInfo, 内容) のタプル
+    """
+    skeleton = _build_financial_workbook(FINANCIAL_PERIOD_PLACEHOLDER)
+    with zipfile.ZipFile(skeleton) as zf:
+        return tuple((info, zf.read(info)) for info in zf.infolist())
+
+
+def generate_financial_template(year: int, month: int) -> io.BytesIO:
+    """
+    財務データ入力用Excelテンプレートを生成する（詳細版）
+
+    キャッシュ済みのxlsxスケルトンの対象年月のみを差し替えて返す。
+
+    Args:
+        year: 対象年
+        month: 対象月
+
+    Returns:
+        Excelファイルのバイトストリーム
+    """
+    placeholder = FINANCIAL_PERIOD_PLACEHOLDER.encode("utf-8")
+    period = f"{year}/{month:02d}/01".encode("utf-8")
+
+    output = io.BytesIO()
+    with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as zf:
+        for info, data in _financial_template_parts():
+            zf.writestr(info, data.replace(placeholder, period))
+    output.seek(0)
+    return output
+
+
 def generate_store_pl_template(
     year: int,
     month: int,
@@ -195,6 +244,7 @@ def generate_store_pl_template(
         Excelファイルのバイトストリーム
     """
     wb = Workbook()
+    _register_named_styles(wb)
     ws = wb.active
     ws.title = "店舗別収支"
 
@@ -239,47 +289,32 @@ def generate_store_pl_template(
     data_start_row = 4
     for i, store in enumerate(stores):
         row = data_start_row + i
-        # 店舗名を表示
-        ws.cell(row=row, column=1, value=store.get("name", "")).border = THIN_BORDER
-        for col in range(2, 11):
-            ws.cell(row=row, column=col).border = THIN_BORDER
+        for (cell,) in ws.iter_cols(min_col=1, max_col=10, min_row=row, max_row=row):
+            cell.style = BORDERED_STYLE
 
+        # 店舗名を表示
+        ws.cell(row=row, column=1, value=store.get("name", ""))
         # 売上総利益 = 売上高 - 売上原価
-        ws.cell(row=row, column=4, value=f"=B{row}-C{row}").border = THIN_BORDER
+        ws.cell(row=row, column=4, value=f"=B{row}-C{row}")
         # 営業利益 = 売上総利益 - 販管費
-        ws.cell(row=row, column=6, value=f"=D{row}-E{row}").border = THIN_BORDER
+        ws.cell(row=row, column=6, value=f"=D{row}-E{row}")
 
     # 合計行
     store_count = len(stores)
     sum_row = data_start_row + store_count
     last_data_row = sum_row - 1
 
-    ws.cell(row=sum_row, column=1, value="合計").font = HEADER_FONT
-    ws.cell(row=sum_row, column=1).fill = HEADER_FILL
-    ws.cell(row=sum_row, column=1).border = THIN_BORDER
-
-    for col in range(2, 11):
+    for col in range(1, 11):
         col_letter = get_column_letter(col)
-        if col in [4, 6]:  # 計算式列はスキップ
-            continue
-        cell = ws.cell(
-            row=sum_row,
-            column=col,
-            value=f"=SUM({col_letter}{data_start_row}:{col_letter}{last_data_row})"
-        )
-        cell.font = HEADER_FONT
-        cell.fill = HEADER_FILL
-        cell.border = THIN_BORDER
-
-    # 売上総利益合計
-    ws.cell(row=sum_row, column=4, value=f"=B{sum_row}-C{sum_row}").font = HEADER_FONT
-    ws.cell(row=sum_row, column=4).fill = HEADER_FILL
-    ws.cell(row=sum_row, column=4).border = THIN_BORDER
-
-    # 営業利益合計
-    ws.cell(row=sum_row, column=6, value=f"=D{sum_row}-E{sum_row}").font = HEADER_FONT
-    ws.cell(row=sum_row, column=6).fill = HEADER_FILL
-    ws.cell(row=sum_row, column=6).border = THIN_BORDER
+        if col == 1:
+            value = "合計"
+        elif col == 4:  # 売上総利益合計
+            value = f"=B{sum_row}-C{sum_row}"
+        elif col == 6:  # 営業利益合計
+            value = f"=D{sum_row}-E{sum_row}"
+        else:
+            value = f"=SUM({col_letter}{data_start_row}:{col_letter}{last_data_row})"
+        ws.cell(row=sum_row, column=col, value=value).style = TOTAL_STYLE
 
     # 説明シートを追加
     ws2 = wb.create_sheet("入力説明")
@@ -327,6 +362,7 @@ def generate_manufacturing_template(year: int, month: int) -> io.BytesIO:
         Excelファイルのバイトストリーム
     """
     wb = Workbook()
+    _register_named_styles(wb)
     ws = wb.active
     ws.title = "日次製造データ"
 
@@ -362,24 +398,26 @@ def generate_manufacturing_template(year: int, month: int) -> io.BytesIO:
     # 月の日数を取得
     _, days_in_month = calendar.monthrange(year, month)
 
-    # データ行を生成
+    # データ行の罫線を矩形単位で一括適用
+    # （日付セルの書式が上書きされないよう、値の書き込みより先に行う）
     data_start_row = 4
+    sum_row = data_start_row + days_in_month
+    for row_cells in ws.iter_rows(
+        min_row=data_start_row, max_row=sum_row - 1, min_col=1, max_col=6
+    ):
+        for cell in row_cells:
+            cell.style = BORDERED_STYLE
+
+    # データ行を生成
     for day in range(1, days_in_month + 1):
         row = data_start_row + day - 1
-        day_date = date(year, month, day)
 
-        ws.cell(row=row, column=1, value=day_date).border = THIN_BORDER
-        ws.cell(row=row, column=2).border = THIN_BORDER
-        ws.cell(row=row, column=3, value=f"=B{row}*60").border = THIN_BORDER
-        ws.cell(row=row, column=4).border = THIN_BORDER
-        ws.cell(row=row, column=5, value=f"=IF(D{row}>0,B{row}/D{row},0)").border = THIN_BORDER
-        ws.cell(row=row, column=6).border = THIN_BORDER
+        ws.cell(row=row, column=1, value=date(year, month, day))
+        ws.cell(row=row, column=3, value=f"=B{row}*60")
+        ws.cell(row=row, column=5, value=f"=IF(D{row}>0,B{row}/D{row},0)")
 
     # 合計行
-    sum_row = data_start_row + days_in_month
-    ws.cell(row=sum_row, column=1, value="合計").font = HEADER_FONT
-    ws.cell(row=sum_row, column=1).fill = HEADER_FILL
-    ws.cell(row=sum_row, column=1).border = THIN_BORDER
+    ws.cell(row=sum_row, column=1, value="合計").style = TOTAL_STYLE
 
     for col in range(2, 7):
         col_letter = get_column_letter(col)
@@ -388,10 +426,7 @@ def generate_manufacturing_template(year: int, month: int) -> io.BytesIO:
         else:
             formula = f"=SUM({col_letter}{data_start_row}:{col_letter}{sum_row-1})"
 
-        cell = ws.cell(row=sum_row, column=col, value=formula)
-        cell.font = HEADER_FONT
-        cell.fill = HEADER_FILL
-        cell.border = THIN_BORDER
+        ws.cell(row=sum_row, column=col, value=formula).style = TOTAL_STYLE
 
     # バイトストリームに保存
     output = io.BytesIO()
@@ -442,8 +477,8 @@ async def download_financial_template(
         output = generate_financial_template(year, month)
         filename = f"financial_template_{year}{month:02d}.xlsx"
 
-        return StreamingResponse(
-            output,
+        return Response(
+            content=output.getvalue(),
             media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             headers={
                 "Content-Disposition": f'attachment; filename="{filename}"'
@@ -494,8 +529,8 @@ async def download_manufacturing_template(
         output = generate_manufacturing_template(year, month)
         filename = f"manufacturing_template_{year}{month:02d}.xlsx"
 
-        return StreamingResponse(
-            output,
+        return Response(
+            content=output.getvalue(),
             media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             headers={
                 "Content-Disposition": f'attachment; filename="{filename}"'
@@ -551,18 +586,14 @@ async def download_store_pl_template(
 
     try:
         # 部門IDを取得
-        dept_response = supabase.table("departments").select(
-            "id"
-        ).eq("slug", department_slug).execute()
+        department_id = await get_department_id_by_slug(supabase, department_slug)
 
-        if not dept_response.data:
+        if not department_id:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"部門が見つかりません: {department_slug}",
             )
 
-        department_id = dept_response.data[0]["id"]
-
         # 店舗一覧を取得
         stores_response = supabase.table("segments").select(
             "id, code, name"
@@ -579,8 +610,8 @@ async def download_store_pl_template(
         output = generate_store_pl_template(year, month, stores)
         filename = f"store_pl_template_{year}{month:02d}.xlsx"
 
-        return StreamingResponse(
-            output,
+        return Response(
+            content=output.getvalue(),
             media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             headers={
                 "Content-Disposition": f'attachment; filename="{filename}"'
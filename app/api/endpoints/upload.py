@@ -14,12 +14,20 @@ CSVファイルのアップロードと処理を行うエンドポイントを
 - POST /upload/manufacturing: 製造データExcelのアップロード
 - POST /upload/receipt-journal: レシートジャーナルCSVのアップロード
 """
-from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, status, Query
-from fastapi.responses import StreamingResponse
+import asyncio
+import hashlib
+import zlib
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Iterable, List, Type, TypeVar
+
+from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, status, Query, Request
+from fastapi.responses import Response
+from pydantic import BaseModel
+from pydantic_core import to_json
 from supabase import Client
-from io import StringIO
 
 from app.api.deps import get_current_user, get_supabase_admin
+from app.core.validators import InputValidator
 from app.schemas.kpi import User
 from app.schemas.upload import (
     StoreKPIUploadResult,
@@ -31,10 +39,12 @@ from app.schemas.financial import (
     FinancialUploadResult,
     FinancialParseError,
     ManufacturingUploadResult,
+    ManufacturingParseError,
     ManufacturingSummary,
     StorePLUploadResult,
     StorePLParseError,
 )
+from app.schemas.daily_sales import ReceiptJournalUploadResult
 from app.services.parser import (
     parse_store_csv,
     parse_product_csv,
@@ -44,6 +54,7 @@ from app.services.parser import (
 from app.services.import_service import (
     import_store_kpi,
     import_product_kpi,
+    get_department_id_by_slug,
     get_segments_for_department,
 )
 from app.services.cache_service import cache
@@ -52,6 +63,7 @@ from app.services.excel_parser import (
     parse_manufacturing_excel,
     get_financial_sample,
     get_manufacturing_sample,
+    run_parser_in_pool,
 )
 from app.services.financial_import_service import (
     import_financial_data,
@@ -67,6 +79,180 @@ from app.services.store_pl_service import (
 router = APIRouter(tags=["アップロード"])
 
 
+# CSVテンプレート（UTF-8 with BOM、Excelで開くため）
+# 内容は固定のため、インポート時に一度だけエンコードしておく
+STORE_CSV_TEMPLATE = ('\ufeff' + """期間,2025年4月1日～2025年4月30日
+店舗CD,店舗名称,今年度(税込小計),今年度(税抜小計),今年度(客数),前年度(税込小計),前年度(客数)
+2,隼人店,0,0,0,0,0
+3,鷹尾店,0,0,0,0,0
+4,中町店,0,0,0,0,0
+5,三股店,0,0,0,0,0
+""").encode('utf-8')
+
+PRODUCT_CSV_TEMPLATE = ('\ufeff' + """期間,2025年4月1日～2025年4月30日
+商品CD,商品名,大分類名,中分類名,小分類名,件数,税込小計,税抜小計
+001,ぎょうざ２０個,ぎょうざ,生ぎょうざ,20個入,0,0,0
+002,ぎょうざ３０個,ぎょうざ,生ぎょうざ,30個入,0,0,0
+010,タレ小,たれ・スープ,たれ,小,0,0,0
+""").encode('utf-8')
+
+
+def _template_etag(content: bytes) -> str:
+    """テンプレート内容からETagを生成する"""
+    return '"' + hashlib.blake2b(content, digest_size=8).hexdigest() + '"'
+
+
+# テンプレート内容のハッシュ（内容が変われば自動的に更新される）
+STORE_CSV_TEMPLATE_ETAG = _template_etag(STORE_CSV_TEMPLATE)
+PRODUCT_CSV_TEMPLATE_ETAG = _template_etag(PRODUCT_CSV_TEMPLATE)
+
+# テンプレートのブラウザキャッシュ期間（秒）
+TEMPLATE_CACHE_MAX_AGE = 3600
+
+
+def _reject_oversized_upload(file: UploadFile) -> None:
+    """
+    ファイルサイズの上限を超えるアップロードを拒否する
+
+    リクエスト全体のサイズはUploadSizeLimitMiddlewareがmultipartの解析前に
+    制限している。ここではスプール済みファイル自体のサイズで判定し、
+    内容をメモリに読み込む・パースする前に413を返す。
+
+    Args:
+        file: アップロードされたファイル
+
+    Raises:
+        HTTPException(413): サイズ上限を超えている場合
+    """
+    size = file.size
+    if size is None:
+        # サイズ不明の場合はスプール先のファイル末尾位置から求める
+        file.file.seek(0, 2)
+        size = file.file.tell()
+        file.file.seek(0)
+
+    if size > InputValidator.MAX_FILE_SIZE:
+        max_mb = InputValidator.MAX_FILE_SIZE // (1024 * 1024)
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"ファイルサイズは{max_mb}MB以下にしてください"
+        )
+
+
+ParseErrorT = TypeVar("ParseErrorT", bound=BaseModel)
+
+
+def _build_parse_errors(
+    model: Type[ParseErrorT],
+    errors: Iterable[Any],
+) -> List[ParseErrorT]:
+    """
+    パース・インポート結果のエラーをレスポンス用モデルに変換する
+
+    サービス層のエラー辞書はスキーマと同じキー構成のため、
+    model_constructで要素ごとのバリデーションを省略する。
+
+    Args:
+        model: エラーモデルクラス（FinancialParseError等）
+        errors: エラー辞書またはエラーメッセージのリスト
+
+    Returns:
+        List[ParseErrorT]: エラーモデルのリスト
+    """
+    return [
+        model.model_construct(**e) if isinstance(e, dict) else model.model_construct(message=str(e))
+        for e in errors
+    ]
+
+
+async def _parse_excel_in_pool(
+    parser: Callable[[bytes], Dict[str, Any]],
+    content: bytes,
+) -> Dict[str, Any]:
+    """
+    Excelパースをプロセスプールで実行する
+
+    Args:
+        parser: parse_financial_excel / parse_manufacturing_excel
+        content: Excelファイルの内容
+
+    Returns:
+        Dict[str, Any]: パース結果
+
+    Raises:
+        HTTPException(503): パース用ワーカープロセスが異常終了した場合
+    """
+    try:
+        return await run_parser_in_pool(parser, content)
+    except BrokenProcessPool:
+        # プールは次回のリクエストで作り直されるため、再試行を促す
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Excelファイルの解析処理が異常終了しました。しばらく待ってから再度アップロードしてください"
+        )
+
+
+# gzipファイルの先頭2バイト
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+def _decompress_upload(content: bytes) -> bytes:
+    """
+    gzip圧縮されたアップロード内容を展開する
+
+    CSVは圧縮率が高いため、回線の遅い環境では.csv.gzでのアップロードを
+    受け付ける。展開後のサイズもアップロード上限で制限する。
+    gzipでない場合はそのまま返す。
+
+    Args:
+        content: アップロードされたファイル内容
+
+    Returns:
+        bytes: 展開後のファイル内容
+
+    Raises:
+        HTTPException(400): gzipの展開に失敗した場合、またはデータが途切れている場合
+        HTTPException(413): 展開後のサイズが上限を超えた場合
+    """
+    if not content.startswith(GZIP_MAGIC):
+        return content
+
+    limit = InputValidator.MAX_FILE_SIZE
+    chunks = []
+    total = 0
+    remaining = content
+    # 複数メンバーを連結したgzip（cat a.gz b.gz）も最後まで展開する
+    while remaining:
+        try:
+            decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            chunk = decompressor.decompress(remaining, limit + 1 - total)
+        except zlib.error as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"gzipファイルの展開に失敗しました: {str(e)}"
+            )
+
+        chunks.append(chunk)
+        total += len(chunk)
+        if total > limit:
+            max_mb = limit // (1024 * 1024)
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"展開後のファイルサイズは{max_mb}MB以下にしてください"
+            )
+
+        if not decompressor.eof:
+            # 途中で切れたgzipは部分的なCSVとして取り込まない
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="gzipファイルが途中で途切れています"
+            )
+        # メンバー末尾のゼロ埋めはgzipモジュールと同様に無視する
+        remaining = decompressor.unused_data.lstrip(b"\x00")
+
+    return b"".join(chunks)
+
+
 # =============================================================================
 # 店舗別CSVアップロード
 # =============================================================================
@@ -151,6 +337,8 @@ async def upload_store_kpi(
     Returns:
         StoreKPIUploadResult: インポート結果
     """
+    _reject_oversized_upload(file)
+
     # ファイル読み込み
     try:
         content = await file.read()
@@ -160,8 +348,11 @@ async def upload_store_kpi(
             detail=f"ファイルの読み込みに失敗しました: {str(e)}"
         )
 
+    # gzip圧縮されている場合は展開
+    content = _decompress_upload(content)
+
     # CSVパース（Excelファイルにも対応）
-    parsed = parse_store_csv(content, file.filename or "")
+    parsed = await asyncio.to_thread(parse_store_csv, content, file.filename or "")
 
     if not parsed["success"]:
         # パースエラー
@@ -180,11 +371,10 @@ async def upload_store_kpi(
     if not department_id:
         # 店舗部門をデフォルトとして取得
         try:
-            dept_response = supabase.table("departments").select("id").eq(
-                "slug", "store"
-            ).single().execute()
-            department_id = dept_response.data["id"]
+            department_id = await get_department_id_by_slug(supabase, "store")
         except Exception:
+            department_id = None
+        if not department_id:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="部門の取得に失敗しました"
@@ -294,6 +484,8 @@ async def upload_product_kpi(
     Returns:
         ProductKPIUploadResult: インポート結果
     """
+    _reject_oversized_upload(file)
+
     # ファイル読み込み
     try:
         content = await file.read()
@@ -303,8 +495,11 @@ async def upload_product_kpi(
             detail=f"ファイルの読み込みに失敗しました: {str(e)}"
         )
 
+    # gzip圧縮されている場合は展開
+    content = _decompress_upload(content)
+
     # CSVパース（Excelファイルにも対応）
-    parsed = parse_product_csv(content, file.filename or "")
+    parsed = await asyncio.to_thread(parse_product_csv, content, file.filename or "")
 
     if not parsed["success"]:
         if parsed["errors"]:
@@ -321,11 +516,10 @@ async def upload_product_kpi(
     department_id = current_user.department_id
     if not department_id:
         try:
-            dept_response = supabase.table("departments").select("id").eq(
-                "slug", "store"
-            ).single().execute()
-            department_id = dept_response.data["id"]
+            department_id = await get_department_id_by_slug(supabase, "store")
         except Exception:
+            department_id = None
+        if not department_id:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="部門の取得に失敗しました"
@@ -389,6 +583,9 @@ async def upload_product_kpi(
                 "text/csv": {}
             }
         },
+        304: {
+            "description": "テンプレート未変更（If-None-Match一致）"
+        },
         400: {
             "description": "無効なCSVタイプ"
         }
@@ -396,37 +593,33 @@ async def upload_product_kpi(
 )
 async def download_template(
     csv_type: str,
+    request: Request,
     current_user: User = Depends(get_current_user),
-) -> StreamingResponse:
+) -> Response:
     """
     CSVテンプレートをダウンロードする
 
+    テンプレート内容のハッシュをETagとして返し、
+    If-None-Matchが一致する場合は本文なしの304を返す。
+
     Args:
         csv_type: CSVタイプ（"store" または "product"）
+        request: リクエスト（If-None-Matchヘッダー参照用）
         current_user: 認証されたユーザー
 
     Returns:
-        StreamingResponse: CSVファイル
+        Response: CSVファイル
     """
     if csv_type == "store":
         # 店舗別CSVテンプレート
-        content = """期間,2025年4月1日～2025年4月30日
-店舗CD,店舗名称,今年度(税込小計),今年度(税抜小計),今年度(客数),前年度(税込小計),前年度(客数)
-2,隼人店,0,0,0,0,0
-3,鷹尾店,0,0,0,0,0
-4,中町店,0,0,0,0,0
-5,三股店,0,0,0,0,0
-"""
+        content = STORE_CSV_TEMPLATE
+        etag = STORE_CSV_TEMPLATE_ETAG
         filename = "store_kpi_template.csv"
 
     elif csv_type == "product":
         # 商品別CSVテンプレート
-        content = """期間,2025年4月1日～2025年4月30日
-商品CD,商品名,大分類名,中分類名,小分類名,件数,税込小計,税抜小計
-001,ぎょうざ２０個,ぎょうざ,生ぎょうざ,20個入,0,0,0
-002,ぎょうざ３０個,ぎょうざ,生ぎょうざ,30個入,0,0,0
-010,タレ小,たれ・スープ,たれ,小,0,0,0
-"""
+        content = PRODUCT_CSV_TEMPLATE
+        etag = PRODUCT_CSV_TEMPLATE_ETAG
         filename = "product_kpi_template.csv"
 
     else:
@@ -435,17 +628,20 @@ async def download_template(
             detail=f"無効なCSVタイプです: {csv_type}（'store' または 'product' を指定してください）"
         )
 
-    # CSVをUTF-8 with BOMで出力（Excelで開くため）
-    output = StringIO()
-    output.write('\ufeff')  # BOM
-    output.write(content)
-    output.seek(0)
+    cache_headers = {
+        "ETag": etag,
+        "Cache-Control": f"private, max-age={TEMPLATE_CACHE_MAX_AGE}",
+    }
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
 
-    return StreamingResponse(
-        iter([output.getvalue().encode('utf-8')]),
+    return Response(
+        content=content,
         media_type="text/csv; charset=utf-8",
         headers={
-            "Content-Disposition": f"attachment; filename={filename}"
+            **cache_headers,
+            "Content-Disposition": f"attachment; filename={filename}",
         }
     )
 
@@ -454,6 +650,23 @@ async def download_template(
 # テスト用エンドポイント（開発環境のみ）
 # =============================================================================
 
+def _json_response(payload: Dict[str, Any]) -> Response:
+    """
+    辞書をpydantic-coreで直接JSONにシリアライズして返す
+
+    response_modelを持たないエンドポイントはjsonable_encoderとjson.dumpsを
+    経由するため、行データを多く含む結果はこちらで高速に変換する。
+    date型はISO形式の文字列に変換される。
+
+    Args:
+        payload: レスポンス内容
+
+    Returns:
+        Response: JSONレスポンス
+    """
+    return Response(content=to_json(payload), media_type="application/json")
+
+
 @router.post(
     "/test/parse-store",
     summary="[テスト] 店舗CSVパース確認",
@@ -466,16 +679,17 @@ async def test_parse_store_csv(
     """
     店舗CSVのパース処理をテストする（認証なし）
     """
-    content = await file.read()
-    parsed = parse_store_csv(content, file.filename or "")
-    return {
+    content = _decompress_upload(await file.read())
+    parsed = await asyncio.to_thread(parse_store_csv, content, file.filename or "")
+    data = parsed["data"]
+    return _json_response({
         "success": parsed["success"],
-        "period": str(parsed["period"]) if parsed["period"] else None,
-        "row_count": len(parsed["data"]),
-        "data_preview": parsed["data"][:3] if parsed["data"] else [],
+        "period": parsed["period"],
+        "row_count": len(data),
+        "data_preview": data[:3],
         "errors": parsed["errors"],
         "warnings": parsed["warnings"],
-    }
+    })
 
 
 @router.post(
@@ -490,43 +704,62 @@ async def test_parse_product_csv(
     """
     商品CSVのパース処理をテストする（認証なし）
     """
-    content = await file.read()
-    parsed = parse_product_csv(content, file.filename or "")
+    content = _decompress_upload(await file.read())
+    parsed = await asyncio.to_thread(parse_product_csv, content, file.filename or "")
+    data = parsed["data"]
 
     # 店舗別統計を集計
-    stores = {}
+    # 店舗ごとの行dictを作らず、(店舗CD, 店舗名) -> 列インデックスで
+    # 件数・売上を並列リストに積み上げる
+    store_index = {}
+    store_codes = []
+    store_names = []
+    product_counts = []
+    total_sales = []
     categories = {}
-    for row in parsed["data"]:
-        store_key = (row.get("store_code", ""), row.get("store_name", ""))
-        if store_key not in stores:
-            stores[store_key] = {"count": 0, "total_sales": 0}
-        stores[store_key]["count"] += 1
-        stores[store_key]["total_sales"] += row.get("sales", 0)
-
-        cat = row.get("category", "不明")
-        categories[cat] = categories.get(cat, 0) + 1
+    # parse_product_csvの行は全キーを持つため添字で参照し、
+    # ループ内で使うメソッドはローカル変数に束縛しておく
+    get_index = store_index.get
+    get_category_count = categories.get
+    for row in data:
+        store_key = (row["store_code"], row["store_name"])
+        i = get_index(store_key)
+        if i is None:
+            i = store_index[store_key] = len(store_codes)
+            store_codes.append(store_key[0])
+            store_names.append(store_key[1])
+            product_counts.append(0)
+            total_sales.append(0)
+        product_counts[i] += 1
+        total_sales[i] += row["sales"]
+
+        cat = row["category"]
+        if cat is None:
+            # to_jsonはNoneキーを"None"と出力するため、json.dumpsと同じ"null"に揃える
+            cat = "null"
+        categories[cat] = get_category_count(cat, 0) + 1
 
     store_stats = [
         {
-            "store_code": k[0],
-            "store_name": k[1],
-            "product_count": v["count"],
-            "total_sales": v["total_sales"],
+            "store_code": store_codes[i],
+            "store_name": store_names[i],
+            "product_count": product_counts[i],
+            "total_sales": total_sales[i],
         }
-        for k, v in sorted(stores.items(), key=lambda x: x[0][0])
+        for i in sorted(range(len(store_codes)), key=store_codes.__getitem__)
     ]
 
-    return {
+    return _json_response({
         "success": parsed["success"],
-        "period": str(parsed["period"]) if parsed["period"] else None,
-        "row_count": len(parsed["data"]),
-        "store_count": len(stores),
+        "period": parsed["period"],
+        "row_count": len(data),
+        "store_count": len(store_stats),
         "store_stats": store_stats,
         "categories": categories,
-        "data_preview": parsed["data"][:5] if parsed["data"] else [],
+        "data_preview": data[:5],
         "errors": parsed["errors"],
         "warnings": parsed["warnings"],
-    }
+    })
 
 
 # =============================================================================
@@ -617,6 +850,8 @@ async def upload_financial_excel(
     Returns:
         FinancialUploadResult: インポート結果
     """
+    _reject_oversized_upload(file)
+
     # ファイル形式チェック
     if not file.filename or not file.filename.endswith(".xlsx"):
         raise HTTPException(
@@ -624,7 +859,9 @@ async def upload_financial_excel(
             detail="Excelファイル（.xlsx形式）をアップロードしてください"
         )
 
-    # ファイル読み込み
+    # Excelパース
+    # パースはCPU処理のため、同時アップロードを並列に処理できるよう
+    # プロセスプールで実行する（ワーカーへはbytesで渡す）
     try:
         content = await file.read()
     except Exception as e:
@@ -632,17 +869,12 @@ async def upload_financial_excel(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"ファイルの読み込みに失敗しました: {str(e)}"
         )
-
-    # Excelパース
-    parsed = parse_financial_excel(content)
+    parsed = await _parse_excel_in_pool(parse_financial_excel, content)
 
     if not parsed["success"]:
         # パースエラー
         if parsed["errors"]:
-            errors = [
-                FinancialParseError(**e) if isinstance(e, dict) else FinancialParseError(message=str(e))
-                for e in parsed["errors"]
-            ]
+            errors = _build_parse_errors(FinancialParseError, parsed["errors"])
             return FinancialUploadResult(
                 success=False,
                 message="データにエラーがあります",
@@ -664,10 +896,7 @@ async def upload_financial_excel(
         )
 
     if not import_result["success"]:
-        errors = [
-            FinancialParseError(message=e) if isinstance(e, str) else FinancialParseError(**e)
-            for e in import_result.get("errors", [])
-        ]
+        errors = _build_parse_errors(FinancialParseError, import_result.get("errors", []))
         return FinancialUploadResult(
             success=False,
             message="データの保存に失敗しました",
@@ -758,6 +987,8 @@ async def upload_manufacturing_excel(
     Returns:
         ManufacturingUploadResult: インポート結果
     """
+    _reject_oversized_upload(file)
+
     # ファイル形式チェック
     if not file.filename or not file.filename.endswith(".xlsx"):
         raise HTTPException(
@@ -765,7 +996,9 @@ async def upload_manufacturing_excel(
             detail="Excelファイル（.xlsx形式）をアップロードしてください"
         )
 
-    # ファイル読み込み
+    # Excelパース
+    # パースはCPU処理のため、同時アップロードを並列に処理できるよう
+    # プロセスプールで実行する（ワーカーへはbytesで渡す）
     try:
         content = await file.read()
     except Exception as e:
@@ -773,18 +1006,12 @@ async def upload_manufacturing_excel(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"ファイルの読み込みに失敗しました: {str(e)}"
         )
-
-    # Excelパース
-    parsed = parse_manufacturing_excel(content)
+    parsed = await _parse_excel_in_pool(parse_manufacturing_excel, content)
 
     if not parsed["success"]:
         # パースエラー
         if parsed["errors"]:
-            from app.schemas.financial import ManufacturingParseError
-            errors = [
-                ManufacturingParseError(**e) if isinstance(e, dict) else ManufacturingParseError(message=str(e))
-                for e in parsed["errors"]
-            ]
+            errors = _build_parse_errors(ManufacturingParseError, parsed["errors"])
             return ManufacturingUploadResult(
                 success=False,
                 message="データにエラーがあります",
@@ -806,11 +1033,7 @@ async def upload_manufacturing_excel(
         )
 
     if not import_result["success"]:
-        from app.schemas.financial import ManufacturingParseError
-        errors = [
-            ManufacturingParseError(message=e) if isinstance(e, str) else ManufacturingParseError(**e)
-            for e in import_result.get("errors", [])
-        ]
+        errors = _build_parse_errors(ManufacturingParseError, import_result.get("errors", []))
         return ManufacturingUploadResult(
             success=False,
             message="データの保存に失敗しました",
@@ -920,6 +1143,8 @@ async def upload_store_pl(
     Returns:
         StorePLUploadResult: インポート結果
     """
+    _reject_oversized_upload(file)
+
     # ファイル読み込み
     try:
         content = await file.read()
@@ -929,16 +1154,16 @@ async def upload_store_pl(
             detail=f"ファイルの読み込みに失敗しました: {str(e)}"
         )
 
+    # gzip圧縮されている場合は展開
+    content = _decompress_upload(content)
+
     # パース
-    parsed = parse_store_pl_file(content, file.filename or "")
+    parsed = await asyncio.to_thread(parse_store_pl_file, content, file.filename or "")
 
     if not parsed["success"]:
         # パースエラー
         if parsed["errors"]:
-            errors = [
-                StorePLParseError(**e) if isinstance(e, dict) else StorePLParseError(message=str(e))
-                for e in parsed["errors"]
-            ]
+            errors = _build_parse_errors(StorePLParseError, parsed["errors"])
             return StorePLUploadResult(
                 success=False,
                 message="データにエラーがあります",
@@ -960,10 +1185,7 @@ async def upload_store_pl(
         )
 
     if not import_result["success"]:
-        errors = [
-            StorePLParseError(**e) if isinstance(e, dict) else StorePLParseError(message=str(e))
-            for e in import_result.get("errors", [])
-        ]
+        errors = _build_parse_errors(StorePLParseError, import_result.get("errors", []))
         return StorePLUploadResult(
             success=False,
             message="データの保存に失敗しました",
@@ -993,6 +1215,7 @@ async def upload_store_pl(
 
 @router.post(
     "/receipt-journal",
+    response_model=ReceiptJournalUploadResult,
     summary="レシートジャーナルCSVをアップロード",
     description="""
     POSレシートジャーナルCSVファイルをアップロードして処理する。
@@ -1039,11 +1262,12 @@ async def upload_receipt_journal(
     file: UploadFile = File(..., description="レシートジャーナルCSV"),
     current_user: User = Depends(get_current_user),
     supabase: Client = Depends(get_supabase_admin),
-):
+) -> ReceiptJournalUploadResult:
     """レシートジャーナルCSVをアップロードして処理する"""
     from app.services.receipt_journal_parser import parse_receipt_journal
     from app.services.daily_sales_import_service import import_receipt_journal
-    from app.schemas.daily_sales import ReceiptJournalUploadResult
+
+    _reject_oversized_upload(file)
 
     # ファイル読み込み
     try:
@@ -1054,8 +1278,11 @@ async def upload_receipt_journal(
             detail=f"ファイルの読み込みに失敗しました: {str(e)}"
         )
 
+    # gzip圧縮されている場合は展開
+    content = _decompress_upload(content)
+
     # パース
-    parsed = parse_receipt_journal(content, file.filename or "")
+    parsed = await asyncio.to_thread(parse_receipt_journal, content, file.filename or "")
 
     if not parsed["success"]:
         if parsed["errors"]:
@@ -1100,6 +1327,11 @@ async def upload_receipt_journal(
 # サンプルデータ取得（開発用）
 # =============================================================================
 
+# サンプル構造は内容が固定のため、JSONバイト列へ一度だけ変換しておく
+_FINANCIAL_SAMPLE_BODY = to_json(get_financial_sample())
+_MANUFACTURING_SAMPLE_BODY = to_json(get_manufacturing_sample())
+
+
 @router.get(
     "/financial/sample",
     summary="財務データサンプル取得",
@@ -1110,7 +1342,7 @@ async def get_financial_sample_data():
     """
     財務データのサンプル構造を取得する
     """
-    return get_financial_sample()
+    return Response(content=_FINANCIAL_SAMPLE_BODY, media_type="application/json")
 
 
 @router.get(
@@ -1123,4 +1355,4 @@ async def get_manufacturing_sample_data():
     """
     製造データのサンプル構造を取得する
     """
-    return get_manufacturing_sample()
+    return Response(content=_MANUFACTURING_SAMPLE_BODY, media_type="application/json")
@@ -4,8 +4,8 @@
 pydantic-settingsを使用して環境変数を型安全に管理する。
 .envファイルからの自動読み込みに対応。
 """
-from functools import lru_cache
-from typing import List
+from functools import cached_property, lru_cache
+from typing import Tuple
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -74,34 +74,35 @@ class Settings(BaseSettings):
     # 承認画面への直リンク生成に使うフロントエンドURL
     APP_BASE_URL: str = "https://kpidash-frontend.vercel.app"
 
-    @property
+    @cached_property
     def smarthr_enabled(self) -> bool:
         """SmartHR連携が有効か（サブドメインとトークンが揃っているか）"""
         return bool(self.SMARTHR_SUBDOMAIN and self.SMARTHR_ACCESS_TOKEN)
 
-    @property
+    @cached_property
     def slack_enabled(self) -> bool:
         """Slack連携が有効か（Botトークンが設定されているか）"""
         return bool(self.SLACK_BOT_TOKEN)
 
-    @property
+    @cached_property
     def ga4_enabled(self) -> bool:
         """GA4連携が有効か（プロパティIDと認証情報が揃っているか）"""
         return bool(self.GA4_PROPERTY_ID and self.GA4_CREDENTIALS_JSON)
 
-    @property
-    def allowed_origins_list(self) -> List[str]:
+    @cached_property
+    def allowed_origins_list(self) -> Tuple[str, ...]:
         """
-        許可されたオリジンをリストで取得
+        許可されたオリジンを取得
 
-        ALLOWED_ORIGINSをカンマで分割してリストに変換する。
+        ALLOWED_ORIGINSをカンマで分割してタプルに変換する。
+        設定は不変のため、分割は初回アクセス時の一度だけ行う。
 
         Returns:
-            List[str]: 許可されたオリジンのリスト
+            Tuple[str, ...]: 許可されたオリジン
         """
-        return [origin.strip() for origin in self.ALLOWED_ORIGINS.split(",")]
+        return tuple(origin.strip() for origin in self.ALLOWED_ORIGINS.split(","))
 
-    @property
+    @cached_property
     def is_development(self) -> bool:
         """
         開発環境かどうかを判定
@@ -111,7 +112,7 @@ class Settings(BaseSettings):
         """
         return self.APP_ENV == "development"
 
-    @property
+    @cached_property
     def is_production(self) -> bool:
         """
         本番環境かどうかを判定
@@ -130,6 +131,8 @@ class Settings(BaseSettings):
         case_sensitive=False,
         # 追加のフィールドを無視
         extra="ignore",
+        # 起動後の設定変更を禁止
+        frozen=True,
     )
 
 
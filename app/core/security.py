@@ -8,12 +8,13 @@ JWT_SECRETを使ったローカル検証を優先し、失敗時はリモート
 してリモートにフォールバックするため、毎リクエストで Supabase Auth API を
 叩くと著しく遅延する）。
 """
+import asyncio
 import logging
 import time
 from typing import Optional, Dict, Any, Tuple
 
+import httpx
 from jose import jwt, JWTError
-from supabase import create_client
 
 from app.core.config import settings
 
@@ -32,6 +33,12 @@ _local_decode_warning_emitted = False
 _REMOTE_VALIDATE_RETRIES = 2      # 追加で最大2回リトライ（合計3回）
 _REMOTE_VALIDATE_BACKOFF = 0.25   # 指数バックオフの基準秒
 
+# リモート検証用の非同期HTTPクライアント（シングルトン）。
+# 同期の supabase.auth.get_user はイベントループをブロックするため、
+# Supabase Auth API（/auth/v1/user）を httpx.AsyncClient で直接呼ぶ。
+_auth_http_client: Optional[httpx.AsyncClient] = None
+_AUTH_HTTP_TIMEOUT_SECONDS = 10.0
+
 
 def _purge_token_cache(now: float) -> None:
     """TTL切れエントリと、超過分の古いエントリを削除する。"""
@@ -46,6 +53,26 @@ def _purge_token_cache(now: float) -> None:
             _TOKEN_CACHE.pop(k, None)
 
 
+def _get_auth_http_client() -> httpx.AsyncClient:
+    """
+    リモート検証用の非同期HTTPクライアントを取得する（シングルトン）
+
+    リクエストごとにクライアントを生成すると接続プールが再利用されず、
+    TCP/TLSハンドシェイクが毎回発生するため、プロセス内で1つを共有する。
+
+    Returns:
+        httpx.AsyncClient: Supabase Auth API向けクライアント
+    """
+    global _auth_http_client
+    if _auth_http_client is None:
+        _auth_http_client = httpx.AsyncClient(
+            base_url=settings.SUPABASE_URL,
+            headers={"apikey": settings.SUPABASE_ANON_KEY},
+            timeout=_AUTH_HTTP_TIMEOUT_SECONDS,
+        )
+    return _auth_http_client
+
+
 class TokenValidationError(Exception):
     """
     トークン検証エラー
@@ -76,7 +103,7 @@ def _decode_token_local(token: str) -> Dict[str, Any]:
     }
 
 
-def _decode_token_remote(token: str) -> Dict[str, Any]:
+async def _decode_token_remote(token: str) -> Dict[str, Any]:
     """Supabase Auth APIでトークンを検証する（フォールバック用）
 
     Supabase 側の一時的な混雑（statement timeout 等）で有効なトークンが
@@ -86,33 +113,35 @@ def _decode_token_remote(token: str) -> Dict[str, Any]:
     リトライ後も復帰できない場合は 503 相当のメッセージで例外を投げ、
     上位でのハンドリングと区別できるようにする。
     """
-    supabase = create_client(
-        settings.SUPABASE_URL,
-        settings.SUPABASE_ANON_KEY
-    )
+    client = _get_auth_http_client()
 
     last_error: Optional[Exception] = None
     for attempt in range(_REMOTE_VALIDATE_RETRIES + 1):
         try:
-            user_response = supabase.auth.get_user(token)
+            response = await client.get(
+                "/auth/v1/user",
+                headers={"Authorization": f"Bearer {token}"},
+            )
+            if response.status_code >= 500:
+                response.raise_for_status()
         except Exception as exc:
             # ネットワーク/サーバ由来の失敗 → 短い待機の後リトライ
             last_error = exc
             if attempt < _REMOTE_VALIDATE_RETRIES:
-                time.sleep(_REMOTE_VALIDATE_BACKOFF * (2 ** attempt))
+                await asyncio.sleep(_REMOTE_VALIDATE_BACKOFF * (2 ** attempt))
                 continue
             break
         else:
-            if user_response and user_response.user:
-                user = user_response.user
+            user = response.json() if response.status_code == 200 else None
+            if user and user.get("id"):
                 return {
-                    "sub": user.id,
-                    "email": user.email,
-                    "app_metadata": user.app_metadata or {},
-                    "user_metadata": user.user_metadata or {},
-                    "role": user.role or "authenticated",
+                    "sub": user["id"],
+                    "email": user.get("email"),
+                    "app_metadata": user.get("app_metadata") or {},
+                    "user_metadata": user.get("user_metadata") or {},
+                    "role": user.get("role") or "authenticated",
                 }
-            # get_user が None を返した = 明示的な「無効」
+            # 4xx またはユーザーなし = 明示的な「無効」
             raise TokenValidationError(
                 "無効なアクセストークンです", status_code=401
             )
@@ -128,7 +157,7 @@ def _decode_token_remote(token: str) -> Dict[str, Any]:
     )
 
 
-def decode_token(token: str) -> Dict[str, Any]:
+async def decode_token(token: str) -> Dict[str, Any]:
     """
     JWTトークンを検証する
 
@@ -172,7 +201,7 @@ def decode_token(token: str) -> Dict[str, Any]:
 
     # フォールバック: Supabase Auth APIで検証
     try:
-        payload = _decode_token_remote(token)
+        payload = await _decode_token_remote(token)
         _TOKEN_CACHE[token] = (payload, now)
         _purge_token_cache(now)
         return payload
@@ -234,7 +263,7 @@ def extract_user_info(payload: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def verify_token(token: str) -> Dict[str, Any]:
+async def verify_token(token: str) -> Dict[str, Any]:
     """
     トークンを検証してユーザー情報を返す
 
@@ -250,7 +279,7 @@ def verify_token(token: str) -> Dict[str, Any]:
     Raises:
         TokenValidationError: トークン検証失敗時
     """
-    payload = decode_token(token)
+    payload = await decode_token(token)
     return extract_user_info(payload)
 
 
@@ -2,37 +2,44 @@
 セキュリティ設定
 """
 import os
-from typing import List
+from types import MappingProxyType
+from typing import Mapping, Tuple
 
 
 class SecurityConfig:
-    """セキュリティ関連の設定"""
+    """セキュリティ関連の設定
 
-    # CORS設定
-    ALLOWED_ORIGINS: List[str] = [
-        origin.strip()
-        for origin in os.getenv("ALLOWED_ORIGINS", "http://localhost:3000").split(",")
-    ]
+    環境変数はインスタンス生成時に一度だけ読み込む。
+    """
 
-    # レート制限設定
-    RATE_LIMIT_REQUESTS: int = int(os.getenv("RATE_LIMIT_REQUESTS", "100"))  # リクエスト数
-    RATE_LIMIT_WINDOW: int = int(os.getenv("RATE_LIMIT_WINDOW", "60"))  # 秒
-
-    # セッション設定
-    SESSION_EXPIRE_MINUTES: int = int(os.getenv("SESSION_EXPIRE_MINUTES", "480"))  # 8時間
-
-    # 監査ログ設定
-    ENABLE_AUDIT_LOG: bool = os.getenv("ENABLE_AUDIT_LOG", "true").lower() == "true"
-
-    # セキュリティヘッダー
-    SECURITY_HEADERS = {
+    # セキュリティヘッダー（読み取り専用の定数）
+    SECURITY_HEADERS: Mapping[str, str] = MappingProxyType({
         "X-Content-Type-Options": "nosniff",
         "X-Frame-Options": "DENY",
         "X-XSS-Protection": "1; mode=block",
         "Strict-Transport-Security": "max-age=31536000; includeSubDomains",
         "Referrer-Policy": "strict-origin-when-cross-origin",
         "Permissions-Policy": "geolocation=(), microphone=(), camera=()",
-    }
+    })
+
+    def __init__(self) -> None:
+        # CORS設定
+        self.ALLOWED_ORIGINS: Tuple[str, ...] = tuple(
+            origin.strip()
+            for origin in os.getenv("ALLOWED_ORIGINS", "http://localhost:3000").split(",")
+        )
+
+        # レート制限設定
+        # インスタンス内のインメモリ制限を使うか（上流で制限する場合はfalse）
+        self.RATE_LIMIT_ENABLED: bool = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+        self.RATE_LIMIT_REQUESTS: int = int(os.getenv("RATE_LIMIT_REQUESTS", "100"))  # リクエスト数
+        self.RATE_LIMIT_WINDOW: int = int(os.getenv("RATE_LIMIT_WINDOW", "60"))  # 秒
+
+        # セッション設定
+        self.SESSION_EXPIRE_MINUTES: int = int(os.getenv("SESSION_EXPIRE_MINUTES", "480"))  # 8時間
+
+        # 監査ログ設定
+        self.ENABLE_AUDIT_LOG: bool = os.getenv("ENABLE_AUDIT_LOG", "true").lower() == "true"
 
 
 security_config = SecurityConfig()
@@ -7,6 +7,10 @@ from typing import Optional
 from fastapi import HTTPException, status
 
 
+# サニタイズ対象の危険な文字
+_SANITIZE_RE = re.compile(r'[<>"\';]')
+
+
 class InputValidator:
     """入力値のバリデーション"""
 
@@ -20,6 +24,9 @@ class InputValidator:
     # 許可されるファイル拡張子
     ALLOWED_EXTENSIONS = {".xlsx", ".xls", ".csv"}
 
+    # 許可される期間タイプ
+    ALLOWED_PERIOD_TYPES = frozenset({"monthly", "quarterly", "yearly", "cumulative"})
+
     @staticmethod
     def validate_year(year: int) -> int:
         """年の妥当性を検証"""
@@ -53,11 +60,10 @@ class InputValidator:
     @staticmethod
     def validate_period_type(period_type: str) -> str:
         """期間タイプの妥当性を検証"""
-        allowed = {"monthly", "quarterly", "yearly", "cumulative"}
-        if period_type not in allowed:
+        if period_type not in InputValidator.ALLOWED_PERIOD_TYPES:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"期間タイプは {', '.join(allowed)} のいずれかを指定してください"
+                detail=f"期間タイプは {', '.join(InputValidator.ALLOWED_PERIOD_TYPES)} のいずれかを指定してください"
             )
         return period_type
 
@@ -89,11 +95,8 @@ class InputValidator:
         """文字列をサニタイズ"""
         if not value:
             return value
-        # 長さ制限
-        value = value[:max_length]
-        # 危険な文字を除去
-        value = re.sub(r'[<>"\';]', '', value)
-        return value.strip()
+        # 長さ制限の上で危険な文字を除去
+        return _SANITIZE_RE.sub('', value[:max_length]).strip()
 
 
 validator = InputValidator()
@@ -6,18 +6,84 @@ Supabase認証と連携し、部門別のKPIデータ管理機能を提供する
 """
 import os
 import asyncio
+import logging
+from contextlib import asynccontextmanager
 from datetime import datetime, date
 
-from fastapi import FastAPI
+import openpyxl
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from pydantic_core import to_json
 from starlette.middleware.gzip import GZipMiddleware
 
 from app.core.config import settings
 from app.core.security_config import security_config
 from app.middleware.rate_limiter import RateLimitMiddleware
 from app.middleware.security_headers import SecurityHeadersMiddleware
+from app.middleware.upload_size_limit import UploadSizeLimitMiddleware
 from app.api.endpoints import auth, upload, kpi, products, ecommerce, comments, regional, templates, dashboard, manufacturing, finance, complaints, targets, users, admin, daily_sales, order_forecast, furusato, board, news, hr, slack, ga4, approvals, approval_types, approval_delegates
 from app.schemas.kpi import HealthResponse, APIInfo
+from app.services.excel_parser import shutdown_parse_pool
+
+
+# =============================================================================
+# ロガー設定
+# =============================================================================
+
+logger = logging.getLogger("app")
+if not logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+
+
+# =============================================================================
+# ライフサイクル
+# =============================================================================
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    アプリケーションの起動・終了処理
+
+    起動時:
+    - 設定内容のログ出力
+    - OpenAPIスキーマの生成
+    - キャッシュウォーミング（バックグラウンド）
+    - ヘルスチェック用時刻の更新タスク開始
+
+    終了時:
+    - パース用プロセスプールの停止
+    """
+    logger.info(
+        "%s v%s が起動しました (環境: %s, デバッグ: %s)",
+        settings.API_TITLE, settings.API_VERSION, settings.APP_ENV, settings.DEBUG,
+    )
+    logger.info("許可オリジン: %s", settings.allowed_origins_list)
+    logger.info(
+        "レート制限: %s, 監査ログ: %s, Gzip圧縮: 有効（1KB以上）, キャッシュ: 有効（インメモリ、TTL: 5分）",
+        "有効" if _RATE_LIMIT_ACTIVE else "無効（開発環境または上流で制限）",
+        "有効" if security_config.ENABLE_AUDIT_LOG else "無効",
+    )
+    if not openpyxl.LXML:
+        logger.warning("lxml が無効です（Excel処理が低速になります）")
+
+    # OpenAPIスキーマは初回の /docs・/openapi.json アクセス時に生成され、
+    # 全モデル分で約1秒イベントループを止めるため、起動時に生成しておく
+    app.openapi()
+
+    # バックグラウンドでキャッシュを温める（起動を遅延させない）
+    warm_task = asyncio.create_task(warm_cache())
+    # ヘルスチェック用の時刻を更新し続ける
+    tick_task = asyncio.create_task(_tick_health_timestamp())
+
+    yield
+
+    tick_task.cancel()
+    warm_task.cancel()
+    shutdown_parse_pool()
+    logger.info("%s を終了します", settings.API_TITLE)
 
 
 # =============================================================================
@@ -31,6 +97,7 @@ app = FastAPI(
     docs_url="/docs",      # Swagger UI
     redoc_url="/redoc",    # ReDoc
     openapi_url="/openapi.json",
+    lifespan=lifespan,
 )
 
 
@@ -51,7 +118,8 @@ app.add_middleware(
     # レスポンスで公開するヘッダー
     expose_headers=["X-Request-ID"],
     # プリフライトリクエストのキャッシュ時間（秒）
-    max_age=600,
+    # ブラウザ側の上限（Chrome: 2時間、Firefox: 24時間）まで再利用させる
+    max_age=86400,
 )
 
 
@@ -59,14 +127,21 @@ app.add_middleware(
 # セキュリティミドルウェア設定
 # =============================================================================
 
+# Gzip圧縮（1KB以上のレスポンスを圧縮）
+# デフォルトの圧縮レベル9はCPU負荷に対して圧縮率の改善が小さいため5とする。
+# セキュリティヘッダーより内側に登録し、圧縮済みレスポンスにヘッダーを付与する。
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# アップロードサイズ制限（multipartの解析・スプール前に413を返す）
+app.add_middleware(UploadSizeLimitMiddleware)
+
 # セキュリティヘッダー（全リクエストに適用）
 app.add_middleware(SecurityHeadersMiddleware)
 
-# Gzip圧縮（1KB以上のレスポンスを圧縮）
-app.add_middleware(GZipMiddleware, minimum_size=1000)
-
 # レート制限（本番環境のみ）
-if os.getenv("APP_ENV") == "production":
+# Cloud Armor / API Gateway 等の上流で制限する場合は RATE_LIMIT_ENABLED=false で無効化する
+_RATE_LIMIT_ACTIVE = os.getenv("APP_ENV") == "production" and security_config.RATE_LIMIT_ENABLED
+if _RATE_LIMIT_ACTIVE:
     app.add_middleware(RateLimitMiddleware)
 
 
@@ -153,6 +228,33 @@ app.include_router(approval_delegates.router, prefix="/api/v1/approval-delegates
 # ルートエンドポイント
 # =============================================================================
 
+# 内容が固定のレスポンスボディは起動時に一度だけシリアライズしておく
+_ROOT_BODY = to_json(APIInfo(
+    title=settings.API_TITLE,
+    version=settings.API_VERSION,
+    description=settings.API_DESCRIPTION,
+    docs_url="/docs",
+))
+
+# ヘルスチェックはtimestamp以外が固定のため、その手前までを保持しておく
+_HEALTH_PREFIX = to_json({
+    "status": "healthy",
+    "environment": settings.APP_ENV,
+    "version": settings.API_VERSION,
+})[:-1] + b',"timestamp":"'
+
+# ヘルスチェック用の時刻（秒精度）。lifespan中のタスクが1秒ごとに更新する
+_health_timestamp: bytes = datetime.now().replace(microsecond=0).isoformat().encode()
+
+
+async def _tick_health_timestamp() -> None:
+    """ヘルスチェック用の時刻を1秒ごとに更新する"""
+    global _health_timestamp
+    while True:
+        _health_timestamp = datetime.now().replace(microsecond=0).isoformat().encode()
+        await asyncio.sleep(1.0)
+
+
 @app.get(
     "/",
     response_model=APIInfo,
@@ -160,7 +262,7 @@ app.include_router(approval_delegates.router, prefix="/api/v1/approval-delegates
     description="APIの基本情報を返す。",
     tags=["システム"],
 )
-async def root() -> APIInfo:
+async def root() -> Response:
     """
     APIのルートエンドポイント
 
@@ -168,14 +270,9 @@ async def root() -> APIInfo:
     ヘルスチェックやAPI確認に使用できる。
 
     Returns:
-        APIInfo: API情報
+        Response: API情報（APIInfo形式のJSON）
     """
-    return APIInfo(
-        title=settings.API_TITLE,
-        version=settings.API_VERSION,
-        description=settings.API_DESCRIPTION,
-        docs_url="/docs",
-    )
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 @app.get(
@@ -190,7 +287,7 @@ async def root() -> APIInfo:
     """,
     tags=["システム"],
 )
-async def health_check() -> HealthResponse:
+async def health_check() -> Response:
     """
     ヘルスチェックエンドポイント
 
@@ -199,18 +296,16 @@ async def health_check() -> HealthResponse:
     アプリケーションの状態を確認するために使用する。
 
     Returns:
-        HealthResponse: ヘルスチェック結果
+        Response: ヘルスチェック結果（HealthResponse形式のJSON）
     """
-    return HealthResponse(
-        status="healthy",
-        environment=settings.APP_ENV,
-        version=settings.API_VERSION,
-        timestamp=datetime.now(),
+    return Response(
+        content=_HEALTH_PREFIX + _health_timestamp + b'"}',
+        media_type="application/json",
     )
 
 
 # =============================================================================
-# イベントハンドラ
+# キャッシュウォーミング
 # =============================================================================
 
 async def warm_cache():
@@ -240,7 +335,7 @@ async def warm_cache():
                 await get_store_summary(supabase, dept["id"], target_month, "monthly")
                 await get_department_summary(supabase, dept["id"], target_month)
             except Exception as e:
-                print(f"   キャッシュウォーミングスキップ ({dept['slug']}): {e}")
+                logger.warning("キャッシュウォーミングスキップ (%s): %s", dept["slug"], e)
 
         # 餃子ニュースを温める（永続キャッシュ news_cache にも保存され、
         # デプロイ・インスタンス再生成の直後から安定して表示できる）
@@ -249,45 +344,11 @@ async def warm_cache():
 
             await get_gyoza_news()
         except Exception as e:
-            print(f"   キャッシュウォーミングスキップ (news): {e}")
+            logger.warning("キャッシュウォーミングスキップ (news): %s", e)
 
-        print(f"   キャッシュウォーミング: 完了")
+        logger.info("キャッシュウォーミング: 完了")
     except Exception as e:
-        print(f"   キャッシュウォーミング: エラー ({e})")
-
-
-@app.on_event("startup")
-async def startup_event():
-    """
-    アプリケーション起動時の処理
-
-    - 設定の読み込み確認
-    - DB接続の初期化（必要に応じて）
-    - キャッシュウォーミング（バックグラウンド）
-    """
-    print(f"🚀 {settings.API_TITLE} v{settings.API_VERSION} が起動しました")
-    print(f"   環境: {settings.APP_ENV}")
-    print(f"   デバッグ: {settings.DEBUG}")
-    print(f"   許可オリジン: {settings.allowed_origins_list}")
-    print(f"   セキュリティヘッダー: 有効")
-    print(f"   レート制限: {'有効' if os.getenv('APP_ENV') == 'production' else '無効（開発環境）'}")
-    print(f"   監査ログ: {'有効' if security_config.ENABLE_AUDIT_LOG else '無効'}")
-    print(f"   Gzip圧縮: 有効（1KB以上）")
-    print(f"   キャッシュ: 有効（インメモリ、TTL: 5分）")
-
-    # バックグラウンドでキャッシュを温める（起動を遅延させない）
-    asyncio.create_task(warm_cache())
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """
-    アプリケーション終了時の処理
-
-    - リソースのクリーンアップ
-    - DB接続のクローズ（必要に応じて）
-    """
-    print(f"👋 {settings.API_TITLE} を終了します")
+        logger.error("キャッシュウォーミング: エラー (%s)", e)
 
 
 # =============================================================================
@@ -302,4 +363,8 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=settings.DEBUG,
+        # uvloopはWindowsに未対応のため、利用可能な場合のみ使う
+        # （本番のDockerfileでは uvloop/httptools を明示指定している）
+        loop="auto",
+        http="auto",
     )
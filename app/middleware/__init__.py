@@ -3,5 +3,6 @@
 """
 from app.middleware.rate_limiter import RateLimitMiddleware
 from app.middleware.security_headers import SecurityHeadersMiddleware
+from app.middleware.upload_size_limit import UploadSizeLimitMiddleware
 
-__all__ = ["RateLimitMiddleware", "SecurityHeadersMiddleware"]
+__all__ = ["RateLimitMiddleware", "SecurityHeadersMiddleware", "UploadSizeLimitMiddleware"]
@@ -2,69 +2,161 @@
 レート制限ミドルウェア
 IPアドレスベースでリクエスト数を制限
 """
+import asyncio
+import json
 import time
-from collections import defaultdict
-from typing import Dict
+from typing import Dict, List, Optional
 
-from fastapi import Request, HTTPException, status
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.security_config import security_config
 
+# バケットを分割するシャード数（2のべき乗）
+RATE_LIMIT_SHARDS = 64
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+# レート制限対象外のパス（ヘルスチェック・ドキュメント）
+_EXCLUDED_PATHS = frozenset({"/health", "/", "/docs", "/redoc", "/openapi.json"})
+
+
+class RateLimitMiddleware:
     """
     シンプルなインメモリレート制限
     本番環境ではRedisベースの実装を推奨
+
+    BaseHTTPMiddlewareはリクエストごとにRequest/Responseの生成と
+    追加タスクの起動を伴うため、ASGIアプリとして直接実装する。
+
+    判定はトークンバケット方式で、IPごとに保持するのは
+    [残りトークン数, 最終補充時刻] の2値のみ。ウィンドウ内の時刻を
+    すべて保持するローリングウィンドウ方式と異なり、メモリ使用量と
+    判定コストがリクエスト上限数に依存しない。
     """
 
-    def __init__(self, app):
-        super().__init__(app)
-        # {ip: [timestamp, ...]}
-        self.requests: Dict[str, list] = defaultdict(list)
+    def __init__(self, app: ASGIApp):
+        self.app = app
         self.max_requests = security_config.RATE_LIMIT_REQUESTS
         self.window_seconds = security_config.RATE_LIMIT_WINDOW
+        # トークンバケット {ip: [残りトークン数, 最終補充時刻(ns)]} をIPのハッシュで分割して保持
+        # 値はその場で更新するためlistで保持する
+        # _is_allowed は await を含まない同期処理のため、ロックなしで一貫性が保たれる
+        self._shards: List[Dict[str, List[float]]] = [{} for _ in range(RATE_LIMIT_SHARDS)]
+        # 時刻はナノ秒の整数で扱う
+        self._window_ns = self.window_seconds * 1_000_000_000
+        # 1ナノ秒あたりの補充トークン数
+        self.refill_rate = self.max_requests / self._window_ns
+        # 429レスポンスは内容が固定のため事前に組み立てておく
+        self._429_body = json.dumps(
+            {"detail": "リクエスト数が制限を超えました。しばらく待ってから再試行してください。"},
+            ensure_ascii=False,
+        ).encode("utf-8")
+        self._429_headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(self._429_body)).encode("latin-1")),
+            (b"retry-after", str(self.window_seconds).encode("latin-1")),
+        ]
+        # アクセスの途絶えたIPを定期的に削除するタスク
+        self._sweeper_task: Optional[asyncio.Task] = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # アプリ起動・終了（lifespan）に合わせてスイーパーを開始・停止する
+        if scope["type"] == "lifespan":
+            await self.app(scope, self._wrap_lifespan_receive(receive), send)
+            return
 
-    async def dispatch(self, request: Request, call_next):
-        # ヘルスチェックはレート制限対象外
-        if request.url.path in ["/health", "/", "/docs", "/redoc", "/openapi.json"]:
-            return await call_next(request)
+        # HTTP以外とヘルスチェック等はレート制限対象外
+        if scope["type"] != "http" or scope["path"] in _EXCLUDED_PATHS:
+            await self.app(scope, receive, send)
+            return
 
         # クライアントIPを取得
-        client_ip = self._get_client_ip(request)
+        client_ip = self._get_client_ip(scope)
 
         # レート制限チェック
         if not self._is_allowed(client_ip):
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail="リクエスト数が制限を超えました。しばらく待ってから再試行してください。"
-            )
+            await self._send_too_many_requests(send)
+            return
+
+        await self.app(scope, receive, send)
+
+    def _wrap_lifespan_receive(self, receive: Receive) -> Receive:
+        """lifespanイベントの受信に合わせてスイーパーを開始・停止するreceiveを返す"""
+        async def lifespan_receive() -> Message:
+            message = await receive()
+            if message["type"] == "lifespan.startup" and self._sweeper_task is None:
+                self._sweeper_task = asyncio.create_task(self._sweeper())
+            elif message["type"] == "lifespan.shutdown":
+                await self._stop_sweeper()
+            return message
 
-        response = await call_next(request)
-        return response
+        return lifespan_receive
 
-    def _get_client_ip(self, request: Request) -> str:
+    async def _stop_sweeper(self) -> None:
+        """スイーパーを停止する（再起動できるよう参照も破棄する）"""
+        task, self._sweeper_task = self._sweeper_task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    def _get_client_ip(self, scope: Scope) -> str:
         """クライアントIPを取得（プロキシ対応）"""
-        forwarded = request.headers.get("X-Forwarded-For")
-        if forwarded:
-            return forwarded.split(",")[0].strip()
-        return request.client.host if request.client else "unknown"
+        for name, value in scope["headers"]:
+            if name == b"x-forwarded-for":
+                client_ip = value.decode("latin-1").partition(",")[0].strip()
+                # 空のヘッダーや先頭が空のリストは接続元IPで判定する
+                if client_ip:
+                    return client_ip
+                break
+        client = scope.get("client")
+        return client[0] if client else "unknown"
 
     def _is_allowed(self, client_ip: str) -> bool:
-        """リクエストが許可されるかチェック"""
-        current_time = time.time()
-        window_start = current_time - self.window_seconds
-
-        # 古いリクエストを削除
-        self.requests[client_ip] = [
-            req_time for req_time in self.requests[client_ip]
-            if req_time > window_start
-        ]
+        """リクエストが許可されるかチェック（トークンバケット方式）"""
+        # 壁時計の変更に影響されないよう単調増加時計を使用
+        now = time.monotonic_ns()
+
+        shard = self._shards[hash(client_ip) & (RATE_LIMIT_SHARDS - 1)]
+        bucket = shard.get(client_ip)
+        if bucket is None:
+            shard[client_ip] = [self.max_requests - 1, now]
+            return True
+
+        # 経過時間に応じてトークンを補充
+        bucket[0] = min(self.max_requests, bucket[0] + (now - bucket[1]) * self.refill_rate)
+        bucket[1] = now
 
         # 制限チェック
-        if len(self.requests[client_ip]) >= self.max_requests:
+        if bucket[0] < 1:
             return False
 
-        # 新しいリクエストを記録
-        self.requests[client_ip].append(current_time)
+        bucket[0] -= 1
         return True
+
+    async def _sweeper(self) -> None:
+        """
+        一定時間アクセスのないIPのバケットを削除する
+
+        ウィンドウ時間以上補充されていないバケットは満タンに戻っているため、
+        削除しても判定結果は変わらない。リクエスト処理を止めないよう
+        シャード単位でイベントループに制御を返しながら走査する。
+        """
+        while True:
+            await asyncio.sleep(self.window_seconds)
+            for shard in self._shards:
+                cutoff = time.monotonic_ns() - self._window_ns
+                for client_ip in [ip for ip, bucket in shard.items() if bucket[1] < cutoff]:
+                    del shard[client_ip]
+                await asyncio.sleep(0)
+
+    async def _send_too_many_requests(self, send: Send) -> None:
+        """事前に組み立てた429レスポンスを送信する"""
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            # 外側のミドルウェアが書き換えても共有リストに影響しないようコピーを渡す
+            "headers": list(self._429_headers),
+        })
+        await send({"type": "http.response.body", "body": self._429_body})
@@ -1,20 +1,35 @@
 """
 セキュリティヘッダーミドルウェア
 """
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.security_config import security_config
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+class SecurityHeadersMiddleware:
     """セキュリティヘッダーを全レスポンスに追加"""
 
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        # 付与するヘッダーはASGI形式（小文字のbytes）に一度だけ変換しておく
+        self._extra_headers = [
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in security_config.SECURITY_HEADERS.items()
+        ]
+        self._extra_header_names = frozenset(name for name, _ in self._extra_headers)
 
-        # セキュリティヘッダーを追加
-        for header_name, header_value in security_config.SECURITY_HEADERS.items():
-            response.headers[header_name] = header_value
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        return response
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # セキュリティヘッダーを追加（同名ヘッダーは上書き）
+                message["headers"] = [
+                    header for header in message.get("headers", ())
+                    if header[0] not in self._extra_header_names
+                ] + self._extra_headers
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
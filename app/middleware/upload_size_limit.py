@@ -0,0 +1,107 @@
+"""
+アップロードサイズ制限ミドルウェア
+multipartの解析前にリクエストボディのサイズを制限
+"""
+import json
+
+from starlette.exceptions import HTTPException
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.validators import InputValidator
+
+# サイズ制限の対象とするパスの接頭辞（CSV/Excelアップロード）
+UPLOAD_PATH_PREFIX = "/upload/"
+
+# multipartの境界文字列・パートヘッダー・他のフォーム項目に許容する余裕分
+MULTIPART_OVERHEAD_BYTES = 1024 * 1024
+
+
+class _BodyTooLarge(HTTPException):
+    """
+    受信済みのボディが上限を超えたことを示す内部例外
+
+    FastAPIはボディ解析中の例外を400に変換するが、HTTPExceptionは
+    そのまま送出するため、413として例外ハンドラーに渡される。
+    """
+
+    def __init__(self, detail: str):
+        super().__init__(status_code=413, detail=detail)
+
+
+class UploadSizeLimitMiddleware:
+    """
+    アップロードのリクエストボディサイズを制限
+
+    FastAPIはハンドラーの実行前にmultipartボディ全体をUploadFileへ
+    スプールするため、ハンドラー内の判定ではメモリ・ディスク使用量を
+    抑えられない。ここでContent-Lengthと実際の受信量を確認し、
+    上限を超えた時点で解析を打ち切って413を返す。
+
+    上限はファイルサイズ上限にmultipartの余裕分を加えた値とし、
+    ファイル自体のサイズはハンドラー側で判定する。
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.max_body_size = InputValidator.MAX_FILE_SIZE + MULTIPART_OVERHEAD_BYTES
+        max_mb = InputValidator.MAX_FILE_SIZE // (1024 * 1024)
+        self._413_detail = f"ファイルサイズは{max_mb}MB以下にしてください"
+        # 413レスポンスは内容が固定のため事前に組み立てておく
+        self._413_body = json.dumps(
+            {"detail": self._413_detail},
+            ensure_ascii=False,
+        ).encode("utf-8")
+        self._413_headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(self._413_body)).encode("latin-1")),
+            (b"connection", b"close"),
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(UPLOAD_PATH_PREFIX):
+            await self.app(scope, receive, send)
+            return
+
+        # Content-Lengthで判明している場合はボディを受信する前に拒否する
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                if value.isdigit() and int(value) > self.max_body_size:
+                    await self._send_payload_too_large(send)
+                    return
+                break
+
+        # チャンク転送等でContent-Lengthがない場合は受信量を数える
+        received = 0
+        response_started = False
+
+        async def receive_wrapper() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_size:
+                    raise _BodyTooLarge(self._413_detail)
+            return message
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        except _BodyTooLarge:
+            if response_started:
+                raise
+            await self._send_payload_too_large(send)
+
+    async def _send_payload_too_large(self, send: Send) -> None:
+        """事前に組み立てた413レスポンスを送信する"""
+        await send({
+            "type": "http.response.start",
+            "status": 413,
+            # 外側のミドルウェアが書き換えても共有リストに影響しないようコピーを渡す
+            "headers": list(self._413_headers),
+        })
+        await send({"type": "http.response.body", "body": self._413_body})
@@ -0,0 +1,11 @@
+"""
+スキーマ共通設定
+
+複数のスキーマモジュールで共有するPydantic設定を定義する。
+"""
+from pydantic import ConfigDict
+
+# 集計結果を返すレスポンス専用モデルの共通設定
+# サービス層で型変換済みの値から生成し、以後変更しないため不変とする。
+# 集計結果の余分なキーは無視する。
+RESPONSE_CONFIG = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
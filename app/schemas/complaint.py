@@ -10,6 +10,8 @@ from enum import Enum
 
 from pydantic import BaseModel, Field
 
+from app.schemas.base import RESPONSE_CONFIG
+
 
 # =============================================================================
 # Enum定義
@@ -60,8 +62,7 @@ class ComplaintTypeMaster(BaseModel):
     name: str = Field(..., description="表示名")
     display_order: int = Field(default=0, description="表示順")
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 class DepartmentTypeMaster(BaseModel):
@@ -70,8 +71,7 @@ class DepartmentTypeMaster(BaseModel):
     name: str = Field(..., description="表示名")
     display_order: int = Field(default=0, description="表示順")
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 class CustomerTypeMaster(BaseModel):
@@ -80,8 +80,7 @@ class CustomerTypeMaster(BaseModel):
     name: str = Field(..., description="表示名")
     display_order: int = Field(default=0, description="表示順")
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 class ComplaintMasterDataResponse(BaseModel):
@@ -90,8 +89,7 @@ class ComplaintMasterDataResponse(BaseModel):
     department_types: List[DepartmentTypeMaster] = Field(default_factory=list, description="発生部署種類一覧")
     customer_types: List[CustomerTypeMaster] = Field(default_factory=list, description="顧客種類一覧")
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # =============================================================================
@@ -195,8 +193,7 @@ class Complaint(BaseModel):
     created_at: datetime = Field(..., description="作成日時")
     updated_at: datetime = Field(..., description="更新日時")
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # =============================================================================
@@ -222,8 +219,7 @@ class ComplaintListItem(BaseModel):
     resolution_cost: Decimal = Field(default=Decimal("0"), description="対応に要した金額")
     created_at: datetime = Field(..., description="作成日時")
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 class ComplaintListResponse(BaseModel):
@@ -234,8 +230,7 @@ class ComplaintListResponse(BaseModel):
     page_size: int = Field(default=20, description="1ページあたり件数")
     total_pages: int = Field(default=1, description="総ページ数")
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # =============================================================================
@@ -270,8 +265,7 @@ class ComplaintMonthlySummary(BaseModel):
     # コスト
     total_resolution_cost: Decimal = Field(default=Decimal("0"), description="対応費用合計")
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 class ComplaintDashboardSummary(BaseModel):
@@ -281,5 +275,4 @@ class ComplaintDashboardSummary(BaseModel):
     yoy_rate: Optional[Decimal] = Field(None, description="前年比（%）")
     in_progress_count: int = Field(default=0, description="対応中件数")
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
@@ -8,6 +8,7 @@ from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
+from app.schemas.base import RESPONSE_CONFIG
 from app.schemas.complaint import ComplaintDashboardSummary
 
 
@@ -21,6 +22,8 @@ class MetricWithComparison(BaseModel):
 
     各指標について、実績値、前年比較、目標比較を含む。
     """
+    model_config = RESPONSE_CONFIG
+
     value: Optional[Decimal] = Field(None, description="実績値")
     previous_year: Optional[Decimal] = Field(None, description="前年実績")
     yoy_rate: Optional[Decimal] = Field(None, description="前年比（%）")
@@ -39,6 +42,8 @@ class CompanySummary(BaseModel):
 
     全社の売上高、粗利益、営業利益などの主要指標を含む。
     """
+    model_config = RESPONSE_CONFIG
+
     period: str = Field(..., description="期間表示（例: '2025年11月'）")
     period_type: str = Field(..., description="期間タイプ（monthly/quarterly/yearly）")
     fiscal_year: int = Field(..., description="会計年度")
@@ -54,6 +59,8 @@ class DepartmentPerformance(BaseModel):
 
     店舗・通販など部門ごとの売上・利益実績を含む。
     """
+    model_config = RESPONSE_CONFIG
+
     department: str = Field(..., description="部門名（店舗/通販）")
     sales: Optional[Decimal] = Field(None, description="売上高")
     sales_yoy_rate: Optional[Decimal] = Field(None, description="前年比（%）")
@@ -68,6 +75,8 @@ class CashFlowData(BaseModel):
 
     営業CF、投資CF、財務CF、フリーCFの今期・前年・前々年の実績を含む。
     """
+    model_config = RESPONSE_CONFIG
+
     # 営業キャッシュフロー
     cf_operating: Optional[Decimal] = Field(None, description="営業CF（今期）")
     cf_operating_prev: Optional[Decimal] = Field(None, description="営業CF（前年）")
@@ -95,6 +104,8 @@ class ManagementIndicators(BaseModel):
 
     原価率、人件費率、客数、客単価などの経営指標を含む。
     """
+    model_config = RESPONSE_CONFIG
+
     cost_rate: MetricWithComparison = Field(..., description="原価率")
     labor_cost_rate: MetricWithComparison = Field(..., description="人件費率")
     customer_count: MetricWithComparison = Field(..., description="客数")
@@ -107,6 +118,8 @@ class ChartDataPoint(BaseModel):
 
     月次の売上・営業利益推移データを含む。
     """
+    model_config = RESPONSE_CONFIG
+
     month: str = Field(..., description="月（YYYY-MM形式）")
     sales: Optional[Decimal] = Field(None, description="売上高")
     operating_profit: Optional[Decimal] = Field(None, description="営業利益")
@@ -122,6 +135,8 @@ class AlertItem(BaseModel):
 
     予算未達など注意が必要な項目を含む。
     """
+    model_config = RESPONSE_CONFIG
+
     category: str = Field(..., description="カテゴリ（売上/利益/部門）")
     name: str = Field(..., description="項目名")
     achievement_rate: Decimal = Field(..., description="達成率（%）")
@@ -140,6 +155,8 @@ class DashboardResponse(BaseModel):
 
     全セクションのデータを含むダッシュボード完全レスポンス。
     """
+    model_config = RESPONSE_CONFIG
+
     company_summary: CompanySummary = Field(..., description="全社サマリー")
     department_performance: List[DepartmentPerformance] = Field(
         default_factory=list,
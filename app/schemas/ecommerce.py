@@ -9,6 +9,8 @@ from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
+from app.schemas.base import RESPONSE_CONFIG
+
 
 # =============================================================================
 # チャネル別実績スキーマ
@@ -16,6 +18,8 @@ from pydantic import BaseModel, Field
 
 class ChannelData(BaseModel):
     """チャネル別実績データ"""
+    model_config = RESPONSE_CONFIG
+
     channel: str = Field(..., description="チャネル名: EC, 電話, FAX, 店舗受付, ふるさと納税")
     sales: Optional[float] = Field(None, description="売上高")
     sales_target: Optional[float] = Field(None, description="売上高目標")
@@ -40,6 +44,8 @@ class ChannelData(BaseModel):
 
 class ChannelTotals(BaseModel):
     """チャネル合計データ"""
+    model_config = RESPONSE_CONFIG
+
     sales: Optional[float] = Field(None, description="売上高合計")
     sales_target: Optional[float] = Field(None, description="売上高目標合計")
     sales_achievement_rate: Optional[float] = Field(None, description="売上高達成率（%）")
@@ -63,6 +69,8 @@ class ChannelTotals(BaseModel):
 
 class ChannelSummaryResponse(BaseModel):
     """チャネル別実績レスポンス"""
+    model_config = RESPONSE_CONFIG
+
     period: str = Field(..., description="対象期間（YYYY-MM-DD）")
     period_type: str = Field(default="monthly", description="期間タイプ")
     fiscal_year: Optional[int] = Field(None, description="会計年度")
@@ -76,6 +84,8 @@ class ChannelSummaryResponse(BaseModel):
 
 class ProductData(BaseModel):
     """商品別実績データ"""
+    model_config = RESPONSE_CONFIG
+
     product_name: str = Field(..., description="商品名")
     product_category: Optional[str] = Field(None, description="商品カテゴリ")
     sales: Optional[float] = Field(None, description="売上高")
@@ -90,6 +100,8 @@ class ProductData(BaseModel):
 
 class ProductSummaryResponse(BaseModel):
     """商品別実績レスポンス"""
+    model_config = RESPONSE_CONFIG
+
     period: str = Field(..., description="対象期間（YYYY-MM-DD）")
     period_type: str = Field(default="monthly", description="期間タイプ")
     fiscal_year: Optional[int] = Field(None, description="会計年度")
@@ -105,6 +117,8 @@ class ProductSummaryResponse(BaseModel):
 
 class CustomerStatsData(BaseModel):
     """顧客別実績データ"""
+    model_config = RESPONSE_CONFIG
+
     new_customers: Optional[int] = Field(None, description="新規顧客数")
     new_customers_target: Optional[int] = Field(None, description="新規顧客数目標")
     new_customers_achievement_rate: Optional[float] = Field(None, description="新規顧客数達成率（%）")
@@ -130,6 +144,8 @@ class CustomerStatsData(BaseModel):
 
 class CustomerSummaryResponse(BaseModel):
     """顧客別実績レスポンス"""
+    model_config = RESPONSE_CONFIG
+
     period: str = Field(..., description="対象期間（YYYY-MM-DD）")
     period_type: str = Field(default="monthly", description="期間タイプ")
     fiscal_year: Optional[int] = Field(None, description="会計年度")
@@ -142,6 +158,8 @@ class CustomerSummaryResponse(BaseModel):
 
 class WebsiteStatsData(BaseModel):
     """HPアクセス数データ"""
+    model_config = RESPONSE_CONFIG
+
     page_views: Optional[int] = Field(None, description="ページビュー数")
     page_views_previous_year: Optional[int] = Field(None, description="前年ページビュー数")
     page_views_two_years_ago: Optional[int] = Field(None, description="前々年ページビュー数")
@@ -161,6 +179,8 @@ class WebsiteStatsData(BaseModel):
 
 class WebsiteStatsResponse(BaseModel):
     """HPアクセス数レスポンス"""
+    model_config = RESPONSE_CONFIG
+
     period: str = Field(..., description="対象期間（YYYY-MM-DD）")
     period_type: str = Field(default="monthly", description="期間タイプ")
     fiscal_year: Optional[int] = Field(None, description="会計年度")
@@ -173,12 +193,16 @@ class WebsiteStatsResponse(BaseModel):
 
 class TrendSeriesData(BaseModel):
     """推移データ系列（フロントエンドグラフ互換形式）"""
+    model_config = RESPONSE_CONFIG
+
     name: str = Field(..., description="系列名（チャネル名、商品名等）")
     values: List[Optional[float]] = Field(..., description="月次値の配列")
 
 
 class TrendResponse(BaseModel):
     """推移データレスポンス"""
+    model_config = RESPONSE_CONFIG
+
     fiscal_year: int = Field(..., description="会計年度")
     metric: str = Field(..., description="指標タイプ")
     months: List[str] = Field(..., description="月ラベル（YYYY-MM形式）")
@@ -191,6 +215,8 @@ class TrendResponse(BaseModel):
 
 class ChannelProductData(BaseModel):
     """チャネル別商品データ"""
+    model_config = RESPONSE_CONFIG
+
     product_name: str = Field(..., description="商品名")
     sales: Optional[float] = Field(None, description="売上高")
     sales_previous_year: Optional[float] = Field(None, description="前年売上高")
@@ -202,6 +228,8 @@ class ChannelProductData(BaseModel):
 
 class ChannelProductSummaryResponse(BaseModel):
     """チャネル別商品売上レスポンス"""
+    model_config = RESPONSE_CONFIG
+
     channel: str = Field(..., description="チャネル名")
     period: str = Field(..., description="対象期間（YYYY-MM-DD）")
     period_type: str = Field(default="monthly", description="期間タイプ")
@@ -215,6 +243,8 @@ class ChannelProductSummaryResponse(BaseModel):
 
 class CustomerDetailData(BaseModel):
     """顧客別詳細データ"""
+    model_config = RESPONSE_CONFIG
+
     sales: Optional[float] = Field(None, description="売上高")
     sales_previous_year: Optional[float] = Field(None, description="前年売上高")
     sales_yoy: Optional[float] = Field(None, description="売上高前年比（%）")
@@ -228,6 +258,8 @@ class CustomerDetailData(BaseModel):
 
 class CustomerDetailSummaryResponse(BaseModel):
     """顧客別詳細レスポンス"""
+    model_config = RESPONSE_CONFIG
+
     customer_type: str = Field(..., description="顧客タイプ（new/repeat）")
     period: str = Field(..., description="対象期間（YYYY-MM-DD）")
     period_type: str = Field(default="monthly", description="期間タイプ")
@@ -9,6 +9,8 @@ from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
+from app.schemas.base import RESPONSE_CONFIG
+
 
 # =============================================================================
 # 財務データスキーマ
@@ -136,6 +138,8 @@ class ManufacturingSampleData(BaseModel):
 
 class CostOfSalesDetail(BaseModel):
     """売上原価明細"""
+    model_config = RESPONSE_CONFIG
+
     purchases: Decimal = Field(default=Decimal("0"), description="仕入高")
     raw_material_purchases: Decimal = Field(default=Decimal("0"), description="原材料仕入高")
     labor_cost: Decimal = Field(default=Decimal("0"), description="労務費")
@@ -146,9 +150,6 @@ class CostOfSalesDetail(BaseModel):
     others: Decimal = Field(default=Decimal("0"), description="その他（差額計算）")
     total: Decimal = Field(default=Decimal("0"), description="売上原価合計")
 
-    class Config:
-        from_attributes = True
-
 
 class CostOfSalesDetailInput(BaseModel):
     """売上原価明細入力"""
@@ -169,6 +170,8 @@ class CostOfSalesDetailInput(BaseModel):
 
 class SGADetail(BaseModel):
     """販管費明細"""
+    model_config = RESPONSE_CONFIG
+
     executive_compensation: Decimal = Field(default=Decimal("0"), description="役員報酬")
     personnel_cost: Decimal = Field(default=Decimal("0"), description="人件費（販管費）")
     delivery_cost: Decimal = Field(default=Decimal("0"), description="配送費")
@@ -180,9 +183,6 @@ class SGADetail(BaseModel):
     others: Decimal = Field(default=Decimal("0"), description="その他（差額計算）")
     total: Decimal = Field(default=Decimal("0"), description="販管費合計")
 
-    class Config:
-        from_attributes = True
-
 
 class SGADetailInput(BaseModel):
     """販管費明細入力"""
@@ -204,6 +204,8 @@ class SGADetailInput(BaseModel):
 
 class FinancialSummaryWithDetails(BaseModel):
     """財務サマリー（詳細展開可能）"""
+    model_config = RESPONSE_CONFIG
+
     period: date_type = Field(..., description="対象月")
 
     # 売上高
@@ -233,9 +235,6 @@ class FinancialSummaryWithDetails(BaseModel):
     cf_financing: Optional[Decimal] = Field(None, description="財務CF")
     cf_free: Optional[Decimal] = Field(None, description="フリーCF")
 
-    class Config:
-        from_attributes = True
-
 
 # =============================================================================
 # 店舗別収支
@@ -243,18 +242,19 @@ class FinancialSummaryWithDetails(BaseModel):
 
 class StorePLSGADetail(BaseModel):
     """店舗別販管費明細"""
+    model_config = RESPONSE_CONFIG
+
     personnel_cost: Decimal = Field(default=Decimal("0"), description="人件費")
     land_rent: Decimal = Field(default=Decimal("0"), description="地代家賃")
     lease_cost: Decimal = Field(default=Decimal("0"), description="賃借料")
     utilities: Decimal = Field(default=Decimal("0"), description="水道光熱費")
     others: Decimal = Field(default=Decimal("0"), description="その他（差額計算）")
 
-    class Config:
-        from_attributes = True
-
 
 class StorePL(BaseModel):
     """店舗別収支"""
+    model_config = RESPONSE_CONFIG
+
     store_id: str = Field(..., description="店舗ID")
     store_code: Optional[str] = Field(None, description="店舗コード")
     store_name: str = Field(..., description="店舗名")
@@ -284,9 +284,6 @@ class StorePL(BaseModel):
     sales_achievement_rate: Optional[Decimal] = Field(None, description="売上高達成率（%）")
     operating_profit_achievement_rate: Optional[Decimal] = Field(None, description="営業利益達成率（%）")
 
-    class Config:
-        from_attributes = True
-
 
 class StorePLInput(BaseModel):
     """店舗別収支入力"""
@@ -328,6 +325,8 @@ class StorePLUploadResult(BaseModel):
 
 class StorePLListResponse(BaseModel):
     """店舗別収支一覧レスポンス"""
+    model_config = RESPONSE_CONFIG
+
     period: date_type = Field(..., description="対象月（基準月）")
     stores: List[StorePL] = Field(default_factory=list, description="店舗別収支リスト")
 
@@ -343,9 +342,6 @@ class StorePLListResponse(BaseModel):
     start_period: Optional[date_type] = Field(None, description="期間開始月")
     end_period: Optional[date_type] = Field(None, description="期間終了月")
 
-    class Config:
-        from_attributes = True
-
 
 # =============================================================================
 # 財務分析レスポンス
@@ -353,6 +349,8 @@ class StorePLListResponse(BaseModel):
 
 class FinancialAnalysisResponse(BaseModel):
     """財務分析レスポンス"""
+    model_config = RESPONSE_CONFIG
+
     period: date_type = Field(..., description="対象月")
     period_type: str = Field(..., description="期間タイプ（monthly/cumulative）")
 
@@ -374,6 +372,3 @@ class FinancialAnalysisResponse(BaseModel):
     sales_achievement_rate: Optional[Decimal] = Field(None, description="売上高達成率（%）")
     gross_profit_achievement_rate: Optional[Decimal] = Field(None, description="売上総利益達成率（%）")
     operating_profit_achievement_rate: Optional[Decimal] = Field(None, description="営業利益達成率（%）")
-
-    class Config:
-        from_attributes = True
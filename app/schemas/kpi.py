@@ -7,11 +7,13 @@ APIのリクエスト/レスポンスで使用するデータモデルを定義
 import datetime as dt
 from datetime import date as DateType, datetime
 from decimal import Decimal
-from typing import Optional, List, Any, Dict
+from typing import Optional, List, Any, Dict, Literal
 from uuid import UUID
 
 from pydantic import BaseModel, Field, ConfigDict
 
+from app.schemas.base import RESPONSE_CONFIG
+
 
 # =============================================================================
 # ユーザー関連スキーマ
@@ -226,6 +228,8 @@ class TargetValueResponse(BaseModel):
     """
     目標値レスポンススキーマ
     """
+    model_config = RESPONSE_CONFIG
+
     id: int = Field(..., description="レコードID")
     segment_id: str = Field(..., description="店舗・拠点ID")
     segment_name: Optional[str] = Field(None, description="店舗名")
@@ -239,6 +243,8 @@ class TargetValueBulkResponse(BaseModel):
     """
     目標値一括登録レスポンススキーマ
     """
+    model_config = RESPONSE_CONFIG
+
     success: bool = Field(..., description="処理成功かどうか")
     created_count: int = Field(default=0, description="新規作成件数")
     updated_count: int = Field(default=0, description="更新件数")
@@ -249,15 +255,30 @@ class TargetMatrixCell(BaseModel):
     """
     目標マトリックスのセル
     """
+    model_config = RESPONSE_CONFIG
+
     target_id: Optional[int] = Field(None, description="目標値ID（未設定の場合null）")
     value: Optional[float] = Field(None, description="目標値")
     last_year_actual: Optional[float] = Field(None, description="前年同月実績")
 
 
+class TargetMatrixKPI(BaseModel):
+    """
+    目標マトリックスの列（KPI）
+    """
+    model_config = RESPONSE_CONFIG
+
+    id: str = Field(..., description="KPI定義ID")
+    name: str = Field(..., description="KPI名")
+    unit: Optional[str] = Field(None, description="単位")
+
+
 class TargetMatrixRow(BaseModel):
     """
     目標マトリックスの行（店舗）
     """
+    model_config = RESPONSE_CONFIG
+
     segment_id: str = Field(..., description="店舗ID")
     segment_code: str = Field(..., description="店舗コード")
     segment_name: str = Field(..., description="店舗名")
@@ -271,9 +292,11 @@ class TargetMatrixResponse(BaseModel):
     店舗×KPIの目標値マトリックスを返す。
     目標値入力画面用。
     """
+    model_config = RESPONSE_CONFIG
+
     fiscal_year: int = Field(..., description="年度")
     month: str = Field(..., description="対象月（YYYY-MM-DD）")
-    kpis: List[Dict[str, Any]] = Field(..., description="KPI定義リスト")
+    kpis: List[TargetMatrixKPI] = Field(..., description="KPI定義リスト")
     rows: List[TargetMatrixRow] = Field(..., description="店舗別データ")
 
 
@@ -355,6 +378,8 @@ class KPIMetric(BaseModel):
 
     単一のKPI指標の実績・目標・達成率などを表す。
     """
+    model_config = RESPONSE_CONFIG
+
     name: str = Field(..., description="KPI名")
     unit: str = Field(..., description="単位")
     category: Optional[str] = Field(None, description="カテゴリ")
@@ -364,7 +389,7 @@ class KPIMetric(BaseModel):
     ytd_target: Optional[float] = Field(None, description="年度累計目標")
     achievement_rate: Optional[float] = Field(None, description="達成率（%）")
     yoy_rate: Optional[float] = Field(None, description="前年比（%）")
-    alert_level: str = Field(default="none", description="アラートレベル（none/warning/critical）")
+    alert_level: Literal["none", "warning", "critical"] = Field(default="none", description="アラートレベル（none/warning/critical）")
 
 
 class CalculatedMetrics(BaseModel):
@@ -373,12 +398,16 @@ class CalculatedMetrics(BaseModel):
 
     派生計算される指標（客単価など）を表す。
     """
+    model_config = RESPONSE_CONFIG
+
     customer_unit_price: Optional[float] = Field(None, description="客単価（円）")
     items_per_customer: Optional[float] = Field(None, description="1人あたり個数")
 
 
 class DepartmentInfo(BaseModel):
     """部門情報"""
+    model_config = RESPONSE_CONFIG
+
     id: str = Field(..., description="部門ID")
     name: str = Field(..., description="部門名")
     slug: str = Field(..., description="部門スラッグ")
@@ -390,6 +419,8 @@ class DepartmentSummary(BaseModel):
 
     部門全体のKPI一覧と達成状況を表す。
     """
+    model_config = RESPONSE_CONFIG
+
     department: DepartmentInfo = Field(..., description="部門情報")
     period: str = Field(..., description="対象期間（YYYY-MM-DD）")
     fiscal_year: int = Field(..., description="年度")
@@ -398,6 +429,8 @@ class DepartmentSummary(BaseModel):
 
 class SegmentInfo(BaseModel):
     """店舗・拠点情報"""
+    model_config = RESPONSE_CONFIG
+
     id: str = Field(..., description="セグメントID")
     name: str = Field(..., description="店舗名")
     code: str = Field(..., description="店舗コード")
@@ -409,6 +442,8 @@ class SegmentDetail(BaseModel):
 
     個別店舗のKPI詳細と計算指標を表す。
     """
+    model_config = RESPONSE_CONFIG
+
     segment: SegmentInfo = Field(..., description="店舗情報")
     period: str = Field(..., description="対象期間（YYYY-MM-DD）")
     fiscal_year: int = Field(..., description="年度")
@@ -418,6 +453,8 @@ class SegmentDetail(BaseModel):
 
 class ChartDatasets(BaseModel):
     """グラフデータセット"""
+    model_config = RESPONSE_CONFIG
+
     actual: List[float] = Field(default_factory=list, description="実績データ")
     target: List[float] = Field(default_factory=list, description="目標データ")
     previous_year: List[float] = Field(default_factory=list, description="前年データ")
@@ -429,6 +466,8 @@ class ChartData(BaseModel):
 
     時系列比較グラフ用のデータを表す（会計年度ベース：9月〜翌8月）。
     """
+    model_config = RESPONSE_CONFIG
+
     kpi_name: str = Field(..., description="KPI名")
     fiscal_year: Optional[int] = Field(None, description="会計年度")
     labels: List[str] = Field(default_factory=list, description="X軸ラベル（YYYY-MM形式、9月起点）")
@@ -441,6 +480,8 @@ class RankingItem(BaseModel):
 
     店舗ランキングの1項目を表す。
     """
+    model_config = RESPONSE_CONFIG
+
     rank: int = Field(..., description="順位")
     segment_id: str = Field(..., description="セグメントID")
     segment_name: str = Field(..., description="店舗名")
@@ -455,11 +496,13 @@ class AlertItem(BaseModel):
 
     未達アラートの1項目を表す。
     """
+    model_config = RESPONSE_CONFIG
+
     department_name: str = Field(..., description="部門名")
     segment_name: str = Field(..., description="店舗名")
     kpi_name: str = Field(..., description="KPI名")
     achievement_rate: float = Field(..., description="達成率（%）")
-    alert_level: str = Field(..., description="アラートレベル（warning/critical）")
+    alert_level: Literal["warning", "critical"] = Field(..., description="アラートレベル（warning/critical）")
     ytd_actual: float = Field(..., description="年度累計実績")
     ytd_target: float = Field(..., description="年度累計目標")
 
@@ -470,6 +513,8 @@ class AlertItem(BaseModel):
 
 class ProductValue(BaseModel):
     """商品グループの値"""
+    model_config = RESPONSE_CONFIG
+
     actual: Optional[float] = Field(None, description="当月実績")
     previous_year: Optional[float] = Field(None, description="前年同月実績")
     yoy_rate: Optional[float] = Field(None, description="前年比（%）")
@@ -479,6 +524,8 @@ class ProductValue(BaseModel):
 
 class StoreProductData(BaseModel):
     """店舗別の商品データ"""
+    model_config = RESPONSE_CONFIG
+
     segment_id: str = Field(..., description="店舗ID")
     segment_code: str = Field(..., description="店舗コード")
     segment_name: str = Field(..., description="店舗名")
@@ -494,9 +541,11 @@ class ProductMatrixResponse(BaseModel):
 
     店舗×商品グループのマトリックスデータを一括取得するためのレスポンス。
     """
+    model_config = RESPONSE_CONFIG
+
     period: str = Field(..., description="対象期間（YYYY-MM-DD）")
     fiscal_year: int = Field(..., description="年度")
-    period_type: str = Field(default="monthly", description="期間タイプ（monthly/cumulative）")
+    period_type: Literal["monthly", "cumulative"] = Field(default="monthly", description="期間タイプ（monthly/cumulative）")
     product_groups: List[str] = Field(..., description="商品グループ名のリスト")
     stores: List[StoreProductData] = Field(..., description="店舗別データ")
     totals: Dict[str, ProductValue] = Field(..., description="商品グループ別合計")
@@ -508,6 +557,8 @@ class ProductMatrixResponse(BaseModel):
 
 class MonthlyValue(BaseModel):
     """月別データ"""
+    model_config = RESPONSE_CONFIG
+
     month: str = Field(..., description="月（YYYY-MM形式）")
     actual: Optional[float] = Field(None, description="実績")
     previous_year: Optional[float] = Field(None, description="前年同月")
@@ -515,6 +566,8 @@ class MonthlyValue(BaseModel):
 
 class StoreMonthlyData(BaseModel):
     """店舗別月次データ"""
+    model_config = RESPONSE_CONFIG
+
     segment_id: str = Field(..., description="店舗ID")
     segment_code: str = Field(..., description="店舗コード")
     segment_name: str = Field(..., description="店舗名")
@@ -529,6 +582,8 @@ class ProductTrendResponse(BaseModel):
     グラフ表示用の商品グループ別月次推移データ。
     全店舗合計と店舗別データの両方を含む。
     """
+    model_config = RESPONSE_CONFIG
+
     product_group: str = Field(..., description="商品グループ名")
     fiscal_year: int = Field(..., description="年度")
     months: List[str] = Field(..., description="月ラベル（YYYY-MM形式）")
@@ -542,6 +597,8 @@ class ProductTrendResponse(BaseModel):
 
 class ProductGroupDetail(BaseModel):
     """商品グループ別詳細"""
+    model_config = RESPONSE_CONFIG
+
     product_group: str = Field(..., description="商品グループ名")
     sales: Optional[float] = Field(None, description="売上")
     sales_previous_year: Optional[float] = Field(None, description="前年売上")
@@ -556,6 +613,8 @@ class ProductGroupDetail(BaseModel):
 
 class ProductItemDetail(BaseModel):
     """個別商品販売データ"""
+    model_config = RESPONSE_CONFIG
+
     product_code: str = Field(..., description="商品コード")
     product_name: str = Field(..., description="商品名")
     product_category: Optional[str] = Field(None, description="商品大分類名")
@@ -573,6 +632,8 @@ class StoreDetailResponse(BaseModel):
 
     店舗の売上・客数・客単価サマリーと商品グループ別詳細。
     """
+    model_config = RESPONSE_CONFIG
+
     segment_id: str = Field(..., description="店舗ID")
     segment_code: str = Field(..., description="店舗コード")
     segment_name: str = Field(..., description="店舗名")
@@ -604,6 +665,8 @@ class StoreDetailResponse(BaseModel):
 
 class StoreSummaryItem(BaseModel):
     """店舗別売上集計アイテム"""
+    model_config = RESPONSE_CONFIG
+
     segment_id: str = Field(..., description="店舗ID")
     segment_code: str = Field(..., description="店舗コード")
     segment_name: str = Field(..., description="店舗名")
@@ -626,6 +689,8 @@ class StoreSummaryItem(BaseModel):
 
 class StoreSummaryTotals(BaseModel):
     """店舗別売上集計合計"""
+    model_config = RESPONSE_CONFIG
+
     sales: Optional[float] = Field(None, description="売上高合計（当月/累計）")
     sales_previous_year: Optional[float] = Field(None, description="売上高合計（前年同月/累計）")
     sales_yoy: Optional[float] = Field(None, description="売上高前年比（%）")
@@ -650,9 +715,11 @@ class StoreSummaryResponse(BaseModel):
     全店舗の売上高・客数・客単価と前年比を一覧表示する。
     単月モードと累計モードに対応。
     """
+    model_config = RESPONSE_CONFIG
+
     period: str = Field(..., description="対象期間（YYYY-MM-DD形式）")
     department_slug: str = Field(..., description="部門スラッグ")
-    period_type: str = Field(default="monthly", description="期間タイプ（monthly/cumulative）")
+    period_type: Literal["monthly", "cumulative"] = Field(default="monthly", description="期間タイプ（monthly/cumulative）")
     fiscal_year: Optional[int] = Field(None, description="会計年度（累計時のみ）")
     stores: List[StoreSummaryItem] = Field(default_factory=list, description="店舗別データ")
     totals: StoreSummaryTotals = Field(..., description="合計")
@@ -664,6 +731,8 @@ class AvailableMonthsResponse(BaseModel):
 
     データベースに格納されている全ての月を返す。
     """
+    model_config = RESPONSE_CONFIG
+
     months: List[str] = Field(default_factory=list, description="利用可能な月のリスト（YYYY-MM-DD形式、降順）")
 
 
@@ -673,6 +742,8 @@ class AvailableMonthsResponse(BaseModel):
 
 class StoreTrendItem(BaseModel):
     """全店舗推移の店舗別データ"""
+    model_config = RESPONSE_CONFIG
+
     segment_id: str = Field(..., description="店舗ID")
     segment_name: str = Field(..., description="店舗名")
     values: List[Optional[float]] = Field(default_factory=list, description="月別売上（monthsと同じ順序・長さ）")
@@ -684,6 +755,8 @@ class StoreTrendAllResponse(BaseModel):
 
     全店舗の月別売上推移を返す。
     """
+    model_config = RESPONSE_CONFIG
+
     fiscal_year: int = Field(..., description="会計年度")
     months: List[str] = Field(default_factory=list, description="月ラベル（YYYY-MM形式）")
     stores: List[StoreTrendItem] = Field(default_factory=list, description="店舗別データ")
@@ -691,6 +764,8 @@ class StoreTrendAllResponse(BaseModel):
 
 class StoreTrendSummary(BaseModel):
     """単一店舗推移のサマリー"""
+    model_config = RESPONSE_CONFIG
+
     total: Optional[float] = Field(None, description="当年合計")
     total_previous_year: Optional[float] = Field(None, description="前年合計")
     total_two_years_ago: Optional[float] = Field(None, description="前々年合計")
@@ -703,6 +778,8 @@ class StoreTrendSingleResponse(BaseModel):
 
     単一店舗の月別売上推移と前年・前々年比較を返す。
     """
+    model_config = RESPONSE_CONFIG
+
     segment_id: str = Field(..., description="店舗ID")
     segment_name: str = Field(..., description="店舗名")
     fiscal_year: int = Field(..., description="会計年度")
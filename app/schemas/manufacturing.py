@@ -4,11 +4,12 @@
 製造部門（工場）のデータ分析用レスポンススキーマを定義する。
 """
 from datetime import date as date_type
-from decimal import Decimal
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
+from app.schemas.base import RESPONSE_CONFIG
+
 
 # =============================================================================
 # 日次データ
@@ -16,12 +17,14 @@ from pydantic import BaseModel, Field
 
 class ManufacturingDailySummary(BaseModel):
     """製造日次データ"""
+    model_config = RESPONSE_CONFIG
+
     date: date_type = Field(..., description="日付")
     production_batts: Optional[int] = Field(None, description="製造量（バット）")
     production_pieces: Optional[int] = Field(None, description="製造量（個）= バット × 60")
     workers_count: Optional[int] = Field(None, description="出勤者数（延べ）")
-    production_per_worker: Optional[Decimal] = Field(None, description="1人あたり製造量（バット）")
-    paid_leave_hours: Optional[Decimal] = Field(None, description="有給取得時間")
+    production_per_worker: Optional[float] = Field(None, description="1人あたり製造量（バット）")
+    paid_leave_hours: Optional[float] = Field(None, description="有給取得時間")
 
 
 # =============================================================================
@@ -30,12 +33,14 @@ class ManufacturingDailySummary(BaseModel):
 
 class ManufacturingMonthlySummary(BaseModel):
     """製造月次サマリー"""
+    model_config = RESPONSE_CONFIG
+
     month: str = Field(..., description="対象月（YYYY-MM形式）")
     total_batts: int = Field(default=0, description="総製造量（バット）")
     total_pieces: int = Field(default=0, description="総製造量（個）")
     total_workers: int = Field(default=0, description="総出勤者数（延べ）")
-    avg_production_per_worker: Optional[Decimal] = Field(None, description="平均1人あたり製造量")
-    total_paid_leave_hours: Decimal = Field(default=Decimal("0"), description="総有給取得時間")
+    avg_production_per_worker: Optional[float] = Field(None, description="平均1人あたり製造量")
+    total_paid_leave_hours: float = Field(default=0.0, description="総有給取得時間")
     working_days: int = Field(default=0, description="稼働日数")
 
 
@@ -45,13 +50,15 @@ class ManufacturingMonthlySummary(BaseModel):
 
 class ManufacturingComparison(BaseModel):
     """製造前年比較データ"""
+    model_config = RESPONSE_CONFIG
+
     period: str = Field(..., description="期間表示")
     current: ManufacturingMonthlySummary = Field(..., description="今期データ")
     previous_year: Optional[ManufacturingMonthlySummary] = Field(None, description="前年データ")
     previous_year2: Optional[ManufacturingMonthlySummary] = Field(None, description="前々年データ")
     yoy_batts_diff: Optional[int] = Field(None, description="前年差（製造量）")
-    yoy_batts_rate: Optional[Decimal] = Field(None, description="前年比（%）")
-    yoy_productivity_diff: Optional[Decimal] = Field(None, description="前年差（1人あたり製造量）")
+    yoy_batts_rate: Optional[float] = Field(None, description="前年比（%）")
+    yoy_productivity_diff: Optional[float] = Field(None, description="前年差（1人あたり製造量）")
 
 
 # =============================================================================
@@ -60,9 +67,11 @@ class ManufacturingComparison(BaseModel):
 
 class ManufacturingChartData(BaseModel):
     """製造グラフ用データ"""
+    model_config = RESPONSE_CONFIG
+
     month: str = Field(..., description="対象月（YYYY-MM形式）")
     total_batts: int = Field(default=0, description="総製造量（バット）")
-    avg_production_per_worker: Optional[Decimal] = Field(None, description="平均1人あたり製造量")
+    avg_production_per_worker: Optional[float] = Field(None, description="平均1人あたり製造量")
     total_workers: int = Field(default=0, description="総出勤者数（延べ）")
 
 
@@ -72,8 +81,10 @@ class ManufacturingChartData(BaseModel):
 
 class ManufacturingAnalysisResponse(BaseModel):
     """製造分析全体レスポンス"""
+    model_config = RESPONSE_CONFIG
+
     period: str = Field(..., description="期間表示")
-    period_type: str = Field(..., description="期間タイプ（monthly/quarterly/yearly）")
+    period_type: Literal["monthly", "quarterly", "yearly"] = Field(..., description="期間タイプ（monthly/quarterly/yearly）")
     summary: ManufacturingMonthlySummary = Field(..., description="月次サマリー")
     daily_data: List[ManufacturingDailySummary] = Field(
         default_factory=list,
@@ -4,10 +4,12 @@
 地区別売上集計・目標設定のリクエスト/レスポンススキーマを定義する。
 """
 from datetime import date
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
+from app.schemas.base import RESPONSE_CONFIG
+
 
 # =============================================================================
 # 地区マスタスキーマ
@@ -15,6 +17,8 @@ from pydantic import BaseModel, Field
 
 class Region(BaseModel):
     """地区情報"""
+    model_config = RESPONSE_CONFIG
+
     id: str = Field(..., description="地区ID")
     name: str = Field(..., description="地区名")
     display_order: int = Field(0, description="表示順")
@@ -22,6 +26,8 @@ class Region(BaseModel):
 
 class RegionListResponse(BaseModel):
     """地区一覧レスポンス"""
+    model_config = RESPONSE_CONFIG
+
     regions: List[Region] = Field(..., description="地区一覧")
 
 
@@ -31,6 +37,8 @@ class RegionListResponse(BaseModel):
 
 class StoreRegionMapping(BaseModel):
     """店舗-地区マッピング"""
+    model_config = RESPONSE_CONFIG
+
     segment_id: str = Field(..., description="店舗ID")
     segment_name: str = Field(..., description="店舗名")
     region_id: Optional[str] = Field(None, description="地区ID")
@@ -39,6 +47,8 @@ class StoreRegionMapping(BaseModel):
 
 class StoreRegionMappingListResponse(BaseModel):
     """店舗-地区マッピング一覧レスポンス"""
+    model_config = RESPONSE_CONFIG
+
     mappings: List[StoreRegionMapping] = Field(..., description="マッピング一覧")
 
 
@@ -59,6 +69,8 @@ class BulkUpdateStoreRegionRequest(BaseModel):
 
 class RegionalStoreData(BaseModel):
     """地区内店舗データ"""
+    model_config = RESPONSE_CONFIG
+
     segment_id: str = Field(..., description="店舗ID")
     segment_name: str = Field(..., description="店舗名")
     sales: Optional[float] = Field(None, description="売上高")
@@ -74,6 +86,8 @@ class RegionalStoreData(BaseModel):
 
 class RegionalProductData(BaseModel):
     """地区別商品データ"""
+    model_config = RESPONSE_CONFIG
+
     product_name: str = Field(..., description="商品名")
     sales: Optional[float] = Field(None, description="売上高")
     sales_previous_year: Optional[float] = Field(None, description="前年売上高")
@@ -82,6 +96,8 @@ class RegionalProductData(BaseModel):
 
 class RegionalSummaryData(BaseModel):
     """地区別集計データ"""
+    model_config = RESPONSE_CONFIG
+
     region_id: str = Field(..., description="地区ID")
     region_name: str = Field(..., description="地区名")
     # 売上高
@@ -110,8 +126,10 @@ class RegionalSummaryData(BaseModel):
 
 class RegionalSummaryResponse(BaseModel):
     """地区別集計レスポンス"""
+    model_config = RESPONSE_CONFIG
+
     period: str = Field(..., description="対象期間（YYYY-MM-DD）")
-    period_type: str = Field(default="monthly", description="期間タイプ")
+    period_type: Literal["monthly", "cumulative"] = Field(default="monthly", description="期間タイプ")
     fiscal_year: Optional[int] = Field(None, description="会計年度")
     regions: List[RegionalSummaryData] = Field(..., description="地区別データ")
     grand_total: Optional[RegionalSummaryData] = Field(None, description="全体合計")
@@ -123,6 +141,8 @@ class RegionalSummaryResponse(BaseModel):
 
 class RegionalTarget(BaseModel):
     """地区別目標"""
+    model_config = RESPONSE_CONFIG
+
     region_id: str = Field(..., description="地区ID")
     region_name: Optional[str] = Field(None, description="地区名")
     month: str = Field(..., description="対象月（YYYY-MM-DD）")
@@ -132,6 +152,8 @@ class RegionalTarget(BaseModel):
 
 class RegionalTargetListResponse(BaseModel):
     """地区別目標一覧レスポンス"""
+    model_config = RESPONSE_CONFIG
+
     month: str = Field(..., description="対象月")
     targets: List[RegionalTarget] = Field(..., description="目標一覧")
 
@@ -47,7 +47,7 @@ class TargetSettingResult(BaseModel):
 class StoreTargetValue(BaseModel):
     """店舗目標値（KPI別）"""
     kpi_id: str = Field(..., description="KPI ID")
-    target_id: Optional[str] = Field(None, description="目標値ID（既存の場合）")
+    target_id: Optional[int] = Field(None, description="目標値ID（既存の場合）")
     value: Optional[Decimal] = Field(None, description="目標値")
     last_year_actual: Optional[Decimal] = Field(None, description="前年実績")
     yoy_rate: Optional[Decimal] = Field(None, description="前年比（%）")
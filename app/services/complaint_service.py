@@ -3,7 +3,7 @@
 
 クレームの登録・取得・更新・削除機能を提供する。
 """
-from datetime import date
+from datetime import date, datetime
 from decimal import Decimal, ROUND_HALF_UP
 from typing import Optional, List, Dict, Any
 import math
@@ -65,6 +65,16 @@ STATUS_NAMES = {
 # ヘルパー関数
 # =============================================================================
 
+def _to_date(value: Any) -> date:
+    """DBの日付値（ISO形式文字列）をdateに変換する"""
+    return value if isinstance(value, date) else date.fromisoformat(value)
+
+
+def _to_datetime(value: Any) -> datetime:
+    """DBの日時値（ISO形式文字列）をdatetimeに変換する"""
+    return value if isinstance(value, datetime) else datetime.fromisoformat(value)
+
+
 def _to_decimal(value: Any) -> Decimal:
     """値をDecimalに変換する"""
     if value is None:
@@ -327,9 +337,10 @@ async def get_complaints(
             if len(content) > 100:
                 content = content[:100] + "..."
 
-            complaints.append(ComplaintListItem(
+            # DBから取得済みの値を型変換して渡すため、検証を省略して生成する
+            complaints.append(ComplaintListItem.model_construct(
                 id=str(row["id"]),
-                incident_date=row["incident_date"],
+                incident_date=_to_date(row["incident_date"]),
                 department_type=row["department_type"],
                 department_type_name=DEPARTMENT_TYPE_NAMES.get(row["department_type"], row["department_type"]),
                 segment_name=segment_name,
@@ -343,10 +354,10 @@ async def get_complaints(
                 response_summary=row.get("response_summary"),
                 handling_notes=row.get("handling_notes"),
                 resolution_cost=_to_decimal(row.get("resolution_cost")),
-                created_at=row["created_at"],
+                created_at=_to_datetime(row["created_at"]),
             ))
 
-        return ComplaintListResponse(
+        return ComplaintListResponse.model_construct(
             complaints=complaints,
             total_count=total_count,
             page=page,
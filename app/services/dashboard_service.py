@@ -88,7 +88,7 @@ async def get_dashboard_data(
         complaint_service.get_dashboard_summary(supabase, start_date),
     )
 
-    return DashboardResponse(
+    return DashboardResponse.model_construct(
         company_summary=company_summary,
         department_performance=department_performance,
         cash_flow=cash_flow,
@@ -166,7 +166,7 @@ async def get_company_summary(
         target_data.get("operating_profit"),
     )
 
-    return CompanySummary(
+    return CompanySummary.model_construct(
         period=period_label,
         period_type=period_type,
         fiscal_year=fiscal_year,
@@ -217,7 +217,7 @@ async def get_department_performance(
     store_sales_prev = store_prev.get("sales_store")
     store_sales_target = store_target.get("sales_store")
 
-    departments.append(DepartmentPerformance(
+    departments.append(DepartmentPerformance.model_construct(
         department="店舗",
         sales=store_sales,
         sales_yoy_rate=_calculate_yoy_rate(store_sales, store_sales_prev),
@@ -231,7 +231,7 @@ async def get_department_performance(
     online_sales_prev = store_prev.get("sales_online")
     online_sales_target = store_target.get("sales_online")
 
-    departments.append(DepartmentPerformance(
+    departments.append(DepartmentPerformance.model_construct(
         department="通販",
         sales=online_sales,
         sales_yoy_rate=_calculate_yoy_rate(online_sales, online_sales_prev),
@@ -280,7 +280,7 @@ async def get_cash_flow(
         supabase, prev2_start, prev2_end, is_target=False
     )
 
-    return CashFlowData(
+    return CashFlowData.model_construct(
         cf_operating=current_data.get("cf_operating"),
         cf_operating_prev=prev_data.get("cf_operating"),
         cf_operating_prev2=prev2_data.get("cf_operating"),
@@ -345,7 +345,7 @@ async def get_management_indicators(
     customer_data = await _get_customer_metrics(supabase, start_date, end_date)
     customer_data_prev = await _get_customer_metrics(supabase, prev_start, prev_end)
 
-    return ManagementIndicators(
+    return ManagementIndicators.model_construct(
         cost_rate=_create_rate_metric(cost_rate_current, cost_rate_prev),
         labor_cost_rate=_create_rate_metric(labor_rate_current, labor_rate_prev),
         customer_count=_create_metric(
@@ -429,7 +429,7 @@ async def get_chart_data(
         target = target_by_month.get(month_str, {})
         prev = prev_by_month.get(prev_month_str, {})
 
-        chart_data.append(ChartDataPoint(
+        chart_data.append(ChartDataPoint.model_construct(
             month=target_month.strftime("%Y-%m"),
             sales=Decimal(str(actual["sales_total"])) if actual.get("sales_total") else None,
             operating_profit=Decimal(str(actual["operating_profit"])) if actual.get("operating_profit") else None,
@@ -491,7 +491,7 @@ async def get_alerts(
             achievement_rate = _calculate_achievement_rate(actual, target)
             if achievement_rate is not None and achievement_rate < 100:
                 severity = "critical" if achievement_rate < 80 else "warning"
-                alerts.append(AlertItem(
+                alerts.append(AlertItem.model_construct(
                     category=category,
                     name=name,
                     achievement_rate=achievement_rate,
@@ -680,7 +680,7 @@ def _create_metric(
     target: Optional[Decimal],
 ) -> MetricWithComparison:
     """MetricWithComparison を作成する"""
-    return MetricWithComparison(
+    return MetricWithComparison.model_construct(
         value=current,
         previous_year=previous,
         yoy_rate=_calculate_yoy_rate(current, previous),
@@ -695,7 +695,7 @@ def _create_rate_metric(
     previous: Optional[Decimal],
 ) -> MetricWithComparison:
     """率指標用の MetricWithComparison を作成する（ポイント差で比較）"""
-    return MetricWithComparison(
+    return MetricWithComparison.model_construct(
         value=current,
         previous_year=previous,
         yoy_rate=None,  # 率の前年比は使用しない
@@ -7,7 +7,7 @@
 import asyncio
 from datetime import date
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from supabase import Client
 
@@ -75,6 +75,53 @@ def safe_divide(a: Optional[float], b: Optional[float]) -> Optional[float]:
     return round(a / b, 0)
 
 
+def yoy_rate_as_float(current: Decimal, previous: Decimal) -> Optional[float]:
+    """前年比（%）をレスポンス用のfloatで返す"""
+    rate = calculate_yoy_rate(current, previous)
+    return float(rate) if rate is not None else None
+
+
+Number = Union[int, float, Decimal]
+
+
+def _as_response_number(value: Optional[Number]) -> Optional[Union[int, float]]:
+    """集計値をレスポンス用に変換する（0・NoneはNone、Decimalはfloat）"""
+    if not value:
+        return None
+    return float(value) if isinstance(value, Decimal) else value
+
+
+def build_metric_fields(
+    key: str,
+    current: Optional[Number],
+    prev: Optional[Number],
+    two_years: Optional[Number],
+) -> Dict[str, Any]:
+    """
+    1指標分の当年・前年・前々年・前年比・前々年比のフィールドを生成する
+
+    集計値が0の場合は未入力としてNoneにする。Decimalの値はfloatで返す。
+
+    Args:
+        key: 指標のフィールド名（例: page_views）
+        current: 当年の集計値
+        prev: 前年の集計値
+        two_years: 前々年の集計値
+
+    Returns:
+        dict: {key}, {key}_previous_year, {key}_two_years_ago, {key}_yoy, {key}_yoy_two_years
+    """
+    # float は2進誤差を持ち込まないよう文字列経由でDecimalにする
+    cur = Decimal(str(current)) if current else None
+    return {
+        key: _as_response_number(current),
+        f"{key}_previous_year": _as_response_number(prev),
+        f"{key}_two_years_ago": _as_response_number(two_years),
+        f"{key}_yoy": yoy_rate_as_float(cur, Decimal(str(prev))) if cur and prev else None,
+        f"{key}_yoy_two_years": yoy_rate_as_float(cur, Decimal(str(two_years))) if cur and two_years else None,
+    }
+
+
 def sum_values(values: List[Dict], key: str) -> Optional[Decimal]:
     """辞書リストから指定キーの合計を計算"""
     total = Decimal("0")
@@ -203,25 +250,13 @@ async def get_channel_summary(
 
         channels.append({
             "channel": ch,
-            "sales": float(sales) if sales else None,
+            **build_metric_fields("sales", sales, sales_prev, sales_two_years),
             "sales_target": float(sales_target) if sales_target else None,
             "sales_achievement_rate": sales_achievement,
-            "sales_previous_year": float(sales_prev) if sales_prev else None,
-            "sales_two_years_ago": float(sales_two_years) if sales_two_years else None,
-            "sales_yoy": calculate_yoy_rate(sales, sales_prev) if sales and sales_prev else None,
-            "sales_yoy_two_years": calculate_yoy_rate(sales, sales_two_years) if sales and sales_two_years else None,
-            "buyers": buyers if buyers else None,
+            **build_metric_fields("buyers", buyers, buyers_prev, buyers_two_years),
             "buyers_target": buyers_target if buyers_target else None,
             "buyers_achievement_rate": buyers_achievement,
-            "buyers_previous_year": buyers_prev if buyers_prev else None,
-            "buyers_two_years_ago": buyers_two_years if buyers_two_years else None,
-            "buyers_yoy": calculate_yoy_rate(Decimal(buyers), Decimal(buyers_prev)) if buyers and buyers_prev else None,
-            "buyers_yoy_two_years": calculate_yoy_rate(Decimal(buyers), Decimal(buyers_two_years)) if buyers and buyers_two_years else None,
-            "unit_price": unit_price,
-            "unit_price_previous_year": unit_price_prev,
-            "unit_price_two_years_ago": unit_price_two_years,
-            "unit_price_yoy": calculate_yoy_rate(Decimal(str(unit_price)), Decimal(str(unit_price_prev))) if unit_price and unit_price_prev else None,
-            "unit_price_yoy_two_years": calculate_yoy_rate(Decimal(str(unit_price)), Decimal(str(unit_price_two_years))) if unit_price and unit_price_two_years else None,
+            **build_metric_fields("unit_price", unit_price, unit_price_prev, unit_price_two_years),
         })
 
         total_sales += sales
@@ -243,25 +278,13 @@ async def get_channel_summary(
     total_buyers_achievement = calculate_achievement_rate(Decimal(total_buyers), Decimal(total_buyers_target)) if total_buyers_target else None
 
     totals = {
-        "sales": float(total_sales) if total_sales else None,
+        **build_metric_fields("sales", total_sales, total_sales_prev, total_sales_two_years),
         "sales_target": float(total_sales_target) if total_sales_target else None,
         "sales_achievement_rate": total_sales_achievement,
-        "sales_previous_year": float(total_sales_prev) if total_sales_prev else None,
-        "sales_two_years_ago": float(total_sales_two_years) if total_sales_two_years else None,
-        "sales_yoy": calculate_yoy_rate(total_sales, total_sales_prev) if total_sales and total_sales_prev else None,
-        "sales_yoy_two_years": calculate_yoy_rate(total_sales, total_sales_two_years) if total_sales and total_sales_two_years else None,
-        "buyers": total_buyers if total_buyers else None,
+        **build_metric_fields("buyers", total_buyers, total_buyers_prev, total_buyers_two_years),
         "buyers_target": total_buyers_target if total_buyers_target else None,
         "buyers_achievement_rate": total_buyers_achievement,
-        "buyers_previous_year": total_buyers_prev if total_buyers_prev else None,
-        "buyers_two_years_ago": total_buyers_two_years if total_buyers_two_years else None,
-        "buyers_yoy": calculate_yoy_rate(Decimal(total_buyers), Decimal(total_buyers_prev)) if total_buyers and total_buyers_prev else None,
-        "buyers_yoy_two_years": calculate_yoy_rate(Decimal(total_buyers), Decimal(total_buyers_two_years)) if total_buyers and total_buyers_two_years else None,
-        "unit_price": total_unit_price,
-        "unit_price_previous_year": total_unit_price_prev,
-        "unit_price_two_years_ago": total_unit_price_two_years,
-        "unit_price_yoy": calculate_yoy_rate(Decimal(str(total_unit_price)), Decimal(str(total_unit_price_prev))) if total_unit_price and total_unit_price_prev else None,
-        "unit_price_yoy_two_years": calculate_yoy_rate(Decimal(str(total_unit_price)), Decimal(str(total_unit_price_two_years))) if total_unit_price and total_unit_price_two_years else None,
+        **build_metric_fields("unit_price", total_unit_price, total_unit_price_prev, total_unit_price_two_years),
     }
 
     return {
@@ -356,7 +379,7 @@ async def get_product_summary(
         reverse=True
     )[:limit]
 
-    # 商品別データを構築
+    # 商品別データを構築（値はレスポンスの型に変換済みとし、検証なしで生成できるようにする）
     products = []
     total_sales = Decimal("0")
     total_sales_prev = Decimal("0")
@@ -376,8 +399,8 @@ async def get_product_summary(
             "sales": float(sales) if sales else None,
             "sales_previous_year": float(sales_prev) if sales_prev else None,
             "sales_two_years_ago": float(sales_two_years) if sales_two_years else None,
-            "sales_yoy": calculate_yoy_rate(sales, sales_prev) if sales and sales_prev else None,
-            "sales_yoy_two_years": calculate_yoy_rate(sales, sales_two_years) if sales and sales_two_years else None,
+            "sales_yoy": yoy_rate_as_float(sales, sales_prev) if sales and sales_prev else None,
+            "sales_yoy_two_years": yoy_rate_as_float(sales, sales_two_years) if sales and sales_two_years else None,
             "quantity": quantity if quantity else None,
             "quantity_previous_year": quantity_prev if quantity_prev else None,
             "quantity_two_years_ago": quantity_two_years if quantity_two_years else None,
@@ -483,33 +506,12 @@ async def get_customer_summary(
             return round((actual / target_val) * 100, 1)
         return None
 
-    data = {
-        "new_customers": current["new_customers"] or None,
-        "new_customers_target": target["new_customers"] or None,
-        "new_customers_achievement_rate": calc_int_achievement(
-            current["new_customers"], target["new_customers"]
-        ),
-        "new_customers_previous_year": prev["new_customers"] or None,
-        "new_customers_two_years_ago": two_years["new_customers"] or None,
-        "new_customers_yoy": calculate_yoy_rate(
-            Decimal(current["new_customers"]), Decimal(prev["new_customers"])
-        ) if current["new_customers"] and prev["new_customers"] else None,
-        "new_customers_yoy_two_years": calculate_yoy_rate(
-            Decimal(current["new_customers"]), Decimal(two_years["new_customers"])
-        ) if current["new_customers"] and two_years["new_customers"] else None,
-        "repeat_customers": current["repeat_customers"] or None,
-        "repeat_customers_target": target["repeat_customers"] or None,
-        "repeat_customers_achievement_rate": calc_int_achievement(
-            current["repeat_customers"], target["repeat_customers"]
-        ),
-        "repeat_customers_previous_year": prev["repeat_customers"] or None,
-        "repeat_customers_two_years_ago": two_years["repeat_customers"] or None,
-        "repeat_customers_yoy": calculate_yoy_rate(
-            Decimal(current["repeat_customers"]), Decimal(prev["repeat_customers"])
-        ) if current["repeat_customers"] and prev["repeat_customers"] else None,
-        "repeat_customers_yoy_two_years": calculate_yoy_rate(
-            Decimal(current["repeat_customers"]), Decimal(two_years["repeat_customers"])
-        ) if current["repeat_customers"] and two_years["repeat_customers"] else None,
+    data = {}
+    for key in ("new_customers", "repeat_customers"):
+        data.update(build_metric_fields(key, current[key], prev[key], two_years[key]))
+        data[f"{key}_target"] = target[key] or None
+        data[f"{key}_achievement_rate"] = calc_int_achievement(current[key], target[key])
+    data.update({
         "total_customers": current["total_customers"] or None,
         "total_customers_target": target["total_customers"] or None,
         "total_customers_achievement_rate": calc_int_achievement(
@@ -519,7 +521,7 @@ async def get_customer_summary(
         "total_customers_two_years_ago": two_years["total_customers"] or None,
         "repeat_rate": calc_repeat_rate(current["repeat_customers"], current["total_customers"]),
         "repeat_rate_previous_year": calc_repeat_rate(prev["repeat_customers"], prev["total_customers"]),
-    }
+    })
 
     return {
         "period": target_month.isoformat(),
@@ -594,35 +596,9 @@ async def get_website_stats(
     prev = sum_stats(prev_data)
     two_years = sum_stats(two_years_data)
 
-    data = {
-        "page_views": current["page_views"] or None,
-        "page_views_previous_year": prev["page_views"] or None,
-        "page_views_two_years_ago": two_years["page_views"] or None,
-        "page_views_yoy": calculate_yoy_rate(
-            Decimal(current["page_views"]), Decimal(prev["page_views"])
-        ) if current["page_views"] and prev["page_views"] else None,
-        "page_views_yoy_two_years": calculate_yoy_rate(
-            Decimal(current["page_views"]), Decimal(two_years["page_views"])
-        ) if current["page_views"] and two_years["page_views"] else None,
-        "unique_visitors": current["unique_visitors"] or None,
-        "unique_visitors_previous_year": prev["unique_visitors"] or None,
-        "unique_visitors_two_years_ago": two_years["unique_visitors"] or None,
-        "unique_visitors_yoy": calculate_yoy_rate(
-            Decimal(current["unique_visitors"]), Decimal(prev["unique_visitors"])
-        ) if current["unique_visitors"] and prev["unique_visitors"] else None,
-        "unique_visitors_yoy_two_years": calculate_yoy_rate(
-            Decimal(current["unique_visitors"]), Decimal(two_years["unique_visitors"])
-        ) if current["unique_visitors"] and two_years["unique_visitors"] else None,
-        "sessions": current["sessions"] or None,
-        "sessions_previous_year": prev["sessions"] or None,
-        "sessions_two_years_ago": two_years["sessions"] or None,
-        "sessions_yoy": calculate_yoy_rate(
-            Decimal(current["sessions"]), Decimal(prev["sessions"])
-        ) if current["sessions"] and prev["sessions"] else None,
-        "sessions_yoy_two_years": calculate_yoy_rate(
-            Decimal(current["sessions"]), Decimal(two_years["sessions"])
-        ) if current["sessions"] and two_years["sessions"] else None,
-    }
+    data = {}
+    for key in ("page_views", "unique_visitors", "sessions"):
+        data.update(build_metric_fields(key, current[key], prev[key], two_years[key]))
 
     return {
         "period": target_month.isoformat(),
@@ -666,9 +642,6 @@ async def get_ecommerce_trend(
         y = fiscal_year - 1 if m >= 9 else fiscal_year
         months.append(date(y, m, 1).isoformat())
 
-    # 前年の月リスト
-    prev_months = get_previous_year_months(months)
-
     month_labels = [m[:7] for m in months]  # YYYY-MM形式
 
     if metric == "channel_sales":
@@ -676,28 +649,20 @@ async def get_ecommerce_trend(
         current_response = supabase.table("ecommerce_channel_sales").select(
             "month, channel, sales, is_target"
         ).in_("month", months).execute()
-        # is_targetがFalseまたはNULLのデータのみを実績として扱う
-        current_actual = [r for r in current_response.data if not r.get("is_target")]
-
-        prev_response = supabase.table("ecommerce_channel_sales").select(
-            "month, channel, sales, is_target"
-        ).in_("month", prev_months).execute()
-        prev_actual = [r for r in prev_response.data if not r.get("is_target")]
+        # is_targetがFalseまたはNULLのデータのみを実績として扱い、チャネル別・月別に振り分ける
+        by_channel: Dict[str, Dict[str, Any]] = {}
+        for r in current_response.data:
+            if not r.get("is_target"):
+                by_channel.setdefault(r["channel"], {})[r["month"]] = r["sales"]
 
         # チャネル別にデータを整形
         data = []
         for ch in CHANNELS:
-            current_by_month = {r["month"]: r["sales"] for r in current_actual if r["channel"] == ch}
-            prev_by_month = {r["month"]: r["sales"] for r in prev_actual if r["channel"] == ch}
-
-            # values配列を生成（フロントエンド互換形式）
-            values = []
-            for i, m in enumerate(months):
-                values.append(current_by_month.get(m))
-
+            current_by_month = by_channel.get(ch, {})
             data.append({
                 "name": ch,
-                "values": values,
+                # values配列を生成（フロントエンド互換形式）
+                "values": [current_by_month.get(m) for m in months],
             })
 
     elif metric == "product_sales":
@@ -706,35 +671,28 @@ async def get_ecommerce_trend(
             "month, product_name, sales"
         ).in_("month", months).is_("channel", "null").execute()
 
-        # 商品別合計を計算
+        # 商品別合計と月別の値を1回の走査で計算
         product_totals = {}
+        by_product: Dict[str, Dict[str, Any]] = {}
         for r in current_response.data:
             name = r["product_name"]
             if name not in product_totals:
                 product_totals[name] = 0
             if r.get("sales"):
                 product_totals[name] += r["sales"]
+            by_product.setdefault(name, {})[r["month"]] = r["sales"]
 
         # 上位10商品
         top_products = sorted(product_totals.items(), key=lambda x: x[1], reverse=True)[:10]
         top_names = [p[0] for p in top_products]
 
-        prev_response = supabase.table("ecommerce_product_sales").select(
-            "month, product_name, sales"
-        ).in_("month", prev_months).in_("product_name", top_names).is_("channel", "null").execute()
-
         data = []
         for name in top_names:
-            current_by_month = {r["month"]: r["sales"] for r in current_response.data if r["product_name"] == name}
-
-            # values配列を生成（フロントエンド互換形式）
-            values = []
-            for i, m in enumerate(months):
-                values.append(current_by_month.get(m))
-
+            current_by_month = by_product[name]
             data.append({
                 "name": name,
-                "values": values,
+                # values配列を生成（フロントエンド互換形式）
+                "values": [current_by_month.get(m) for m in months],
             })
 
     elif metric == "customers":
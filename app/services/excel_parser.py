@@ -9,14 +9,19 @@ Step 1で作成したテンプレート形式に対応。
 - 製造データExcelのパース
 - バリデーション処理
 """
+import asyncio
 import io
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import date, datetime
 from decimal import Decimal, InvalidOperation
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 
-from openpyxl import load_workbook
-from openpyxl.cell.cell import Cell
-from openpyxl.worksheet.worksheet import Worksheet
+from openpyxl.utils.cell import coordinate_from_string, column_index_from_string
+from python_calamine import CalamineWorkbook
 
 
 # =============================================================================
@@ -59,7 +64,7 @@ SECTION_HEADERS = [
 # ユーティリティ関数
 # =============================================================================
 
-def get_cell_value(cell: Cell, data_only: bool = True) -> Any:
+def get_cell_value(cell: Any, data_only: bool = True) -> Any:
     """
     セルの値を取得する
 
@@ -75,6 +80,84 @@ def get_cell_value(cell: Cell, data_only: bool = True) -> Any:
     return cell.value
 
 
+class _SheetCell(NamedTuple):
+    """calamineで読み込んだセル値（openpyxlのCell.value互換）"""
+    value: Any
+
+
+class _CalamineSheet:
+    """
+    calamineで読み込んだシートをopenpyxlのWorksheet互換で参照するための薄いラッパー
+
+    パーサーが使用する ws["B1"] / ws.cell(row=, column=) / ws.max_row のみを提供する。
+    空セル（calamineでは空文字）はopenpyxlと同様にNoneとして扱う。
+    """
+
+    def __init__(self, rows: List[List[Any]]):
+        self._rows = rows
+        self.max_row = len(rows)
+
+    def cell(self, row: int, column: int) -> _SheetCell:
+        if row > self.max_row:
+            return _SheetCell(None)
+        values = self._rows[row - 1]
+        if column > len(values):
+            return _SheetCell(None)
+        value = values[column - 1]
+        return _SheetCell(None if value == "" else value)
+
+    def __getitem__(self, coordinate: str) -> _SheetCell:
+        column_letter, row = coordinate_from_string(coordinate)
+        return self.cell(row=row, column=column_index_from_string(column_letter))
+
+
+class _CalamineWorkbookAdapter:
+    """
+    calamineワークブックをopenpyxlのWorkbook互換で参照するための薄いラッパー
+
+    wb.sheetnames / wb[シート名] / wb.active のみを提供し、
+    シートは初回参照時に読み込む。
+    """
+
+    def __init__(self, workbook: CalamineWorkbook):
+        self._workbook = workbook
+        self._sheets: Dict[str, _CalamineSheet] = {}
+        self.sheetnames: List[str] = list(workbook.sheet_names)
+
+    def __getitem__(self, name: str) -> _CalamineSheet:
+        if name not in self._sheets:
+            rows = self._workbook.get_sheet_by_name(name).to_python(skip_empty_area=False)
+            self._sheets[name] = _CalamineSheet(rows)
+        return self._sheets[name]
+
+    @property
+    def active(self) -> Optional[_CalamineSheet]:
+        # calamineはアクティブシート情報を持たないため先頭シートを使用する
+        if not self.sheetnames:
+            return None
+        return self[self.sheetnames[0]]
+
+
+def _load_excel_workbook(file_content: bytes) -> _CalamineWorkbookAdapter:
+    """
+    Excelワークブックを読み込む
+
+    Rust実装のcalamineで読み込むため、openpyxlより高速かつ省メモリ。
+    数式セルはファイルに保存された計算結果を返す（openpyxlのdata_only=True相当）。
+
+    Args:
+        file_content: Excelファイルの内容（バイト列）
+
+    Returns:
+        openpyxl互換のワークブックラッパー
+    """
+    return _CalamineWorkbookAdapter(CalamineWorkbook.from_filelike(io.BytesIO(file_content)))
+
+
+# "YYYY/MM/DD"・"YYYY-MM-DD" 形式（strptime の %Y, %m, %d が受け付ける範囲と同一）
+_YMD_PATTERN = re.compile(r"(\d{4})([/-])(1[0-2]|0[1-9]|[1-9])\2(3[01]|[12]\d|0[1-9]|[1-9])")
+
+
 def parse_date_value(value: Any) -> Optional[date]:
     """
     日付値をパースする
@@ -95,6 +178,15 @@ def parse_date_value(value: Any) -> Optional[date]:
         return value
 
     if isinstance(value, str):
+        # 大半を占める "YYYY/MM/DD"・"YYYY-MM-DD" は、書式ごとに例外を伴う
+        # strptime を経由せず直接変換する（存在しない日付は None）
+        match = _YMD_PATTERN.fullmatch(value.strip())
+        if match:
+            try:
+                return date(int(match[1]), int(match[3]), int(match[4]))
+            except ValueError:
+                return None
+
         # "YYYY/MM/DD" 形式
         for fmt in ["%Y/%m/%d", "%Y-%m-%d", "%Y年%m月%d日"]:
             try:
@@ -231,8 +323,8 @@ def parse_financial_excel(file_content: bytes) -> Dict[str, Any]:
     }
 
     try:
-        # Excelファイルを読み込み（data_only=Trueで数式の計算結果を取得）
-        wb = load_workbook(io.BytesIO(file_content), data_only=True)
+        # Excelファイルを読み込み（数式は保存済みの計算結果を取得）
+        wb = _load_excel_workbook(file_content)
 
         # 「月次財務データ」シートを明示的に指定（アクティブシートに依存しない）
         target_sheet_name = "月次財務データ"
@@ -337,7 +429,7 @@ def _parse_cost_detail_sheet(wb, month: str) -> Optional[Dict[str, Any]]:
     売上原価明細シートをパースする
 
     Args:
-        wb: openpyxlワークブック
+        wb: ワークブック
         month: 対象月（メインシートから取得）
 
     Returns:
@@ -373,7 +465,7 @@ def _parse_sga_detail_sheet(wb, month: str) -> Optional[Dict[str, Any]]:
     販管費明細シートをパースする
 
     Args:
-        wb: openpyxlワークブック
+        wb: ワークブック
         month: 対象月（メインシートから取得）
 
     Returns:
@@ -467,8 +559,8 @@ def parse_manufacturing_excel(file_content: bytes) -> Dict[str, Any]:
     }
 
     try:
-        # Excelファイルを読み込み（data_only=Trueで数式の計算結果を取得）
-        wb = load_workbook(io.BytesIO(file_content), data_only=True)
+        # Excelファイルを読み込み（数式は保存済みの計算結果を取得）
+        wb = _load_excel_workbook(file_content)
         ws = wb.active
 
         if ws is None:
@@ -686,6 +778,67 @@ def validate_manufacturing_row(
     return errors
 
 
+# =============================================================================
+# プロセスプールでのパース実行
+# =============================================================================
+
+# パースはCPU処理でGILを保持するため、同時アップロードを別プロセスで並列に処理する
+PARSE_POOL_MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """
+    Excelパース用のプロセスプールを取得する（初回利用時に生成）
+
+    親プロセスのスレッド（HTTPクライアント等）を引き継がないよう、
+    ワーカーはspawnで起動する。
+
+    Returns:
+        ProcessPoolExecutor: プロセスプール
+    """
+    global _parse_pool
+    if _parse_pool is None:
+        _parse_pool = ProcessPoolExecutor(
+            max_workers=PARSE_POOL_MAX_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _parse_pool
+
+
+async def run_parser_in_pool(
+    parser: Callable[[bytes], Dict[str, Any]],
+    file_content: bytes,
+) -> Dict[str, Any]:
+    """
+    パース関数をプロセスプールで実行する
+
+    Args:
+        parser: parse_financial_excel / parse_manufacturing_excel
+        file_content: Excelファイルの内容（バイト列）
+
+    Returns:
+        Dict[str, Any]: パース関数の戻り値
+    """
+    global _parse_pool
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(_get_parse_pool(), parser, file_content)
+    except BrokenProcessPool:
+        # ワーカーが異常終了した場合、次回のリクエストで作り直す
+        _parse_pool = None
+        raise
+
+
+def shutdown_parse_pool() -> None:
+    """プロセスプールを終了する（アプリケーション終了時に呼び出す）"""
+    global _parse_pool
+    if _parse_pool is not None:
+        _parse_pool.shutdown(wait=False, cancel_futures=True)
+        _parse_pool = None
+
+
 # =============================================================================
 # サンプルデータ生成（テスト用）
 # =============================================================================
@@ -17,6 +17,11 @@ from supabase import Client
 from app.services.cache_service import cache
 
 
+# 1回のUpsertで送信する最大行数。
+# PostgreSQLのバインドパラメータ上限（約34,000）に収まるよう余裕を持たせる。
+UPSERT_BATCH_SIZE = 500
+
+
 # =============================================================================
 # 会計年度計算
 # =============================================================================
@@ -41,6 +46,41 @@ def calculate_fiscal_year(target_date: date) -> int:
         return target_date.year - 1
 
 
+# =============================================================================
+# バッチUpsert
+# =============================================================================
+
+def _upsert_in_batches(
+    supabase: Client,
+    table: str,
+    records: List[Dict[str, Any]],
+    on_conflict: str
+) -> List[Dict[str, Any]]:
+    """
+    レコードをUPSERT_BATCH_SIZE件ずつまとめてUpsertする
+
+    1行ごとに往復するのではなく、バッチ単位で1リクエストにまとめる。
+
+    Args:
+        supabase: Supabaseクライアント
+        table: テーブル名
+        records: Upsertするレコードのリスト
+        on_conflict: 競合判定に使うカラム（カンマ区切り）
+
+    Returns:
+        List[Dict[str, Any]]: Upsertされたレコード
+    """
+    upserted: List[Dict[str, Any]] = []
+    for start in range(0, len(records), UPSERT_BATCH_SIZE):
+        response = supabase.table(table).upsert(
+            records[start:start + UPSERT_BATCH_SIZE],
+            on_conflict=on_conflict
+        ).execute()
+        if response.data:
+            upserted.extend(response.data)
+    return upserted
+
+
 # =============================================================================
 # 財務データインポート
 # =============================================================================
@@ -111,16 +151,13 @@ async def import_financial_data(
             "month", month
         ).eq("is_target", is_target).execute()
 
-        if existing.data:
-            # 更新
-            response = supabase.table("financial_data").update(record).eq(
-                "id", existing.data[0]["id"]
-            ).execute()
-            result["action"] = "updated"
-        else:
-            # 挿入
-            response = supabase.table("financial_data").insert(record).execute()
-            result["action"] = "inserted"
+        result["action"] = "updated" if existing.data else "inserted"
+
+        # Upsert実行（ユニーク制約で挿入/更新を判定）
+        response = supabase.table("financial_data").upsert(
+            record,
+            on_conflict="month,is_target"
+        ).execute()
 
         if response.data:
             result["success"] = True
@@ -171,19 +208,11 @@ async def _import_cost_details(
     }
 
     try:
-        # 既存データを検索
-        existing = supabase.table("financial_cost_details").select("id").eq(
-            "period", month
-        ).eq("is_target", is_target).execute()
-
-        if existing.data:
-            # 更新
-            supabase.table("financial_cost_details").update(record).eq(
-                "id", existing.data[0]["id"]
-            ).execute()
-        else:
-            # 挿入
-            supabase.table("financial_cost_details").insert(record).execute()
+        # Upsert実行（ユニーク制約: (period, is_target)）
+        supabase.table("financial_cost_details").upsert(
+            record,
+            on_conflict="period,is_target"
+        ).execute()
 
     except Exception as e:
         # 原価明細の保存エラーはログに記録するが、全体の成功には影響しない
@@ -212,19 +241,11 @@ async def _import_sga_details(
     }
 
     try:
-        # 既存データを検索
-        existing = supabase.table("financial_sga_details").select("id").eq(
-            "period", month
-        ).eq("is_target", is_target).execute()
-
-        if existing.data:
-            # 更新
-            supabase.table("financial_sga_details").update(record).eq(
-                "id", existing.data[0]["id"]
-            ).execute()
-        else:
-            # 挿入
-            supabase.table("financial_sga_details").insert(record).execute()
+        # Upsert実行（ユニーク制約: (period, is_target)）
+        supabase.table("financial_sga_details").upsert(
+            record,
+            on_conflict="period,is_target"
+        ).execute()
 
     except Exception as e:
         # 販管費明細の保存エラーはログに記録するが、全体の成功には影響しない
@@ -328,13 +349,12 @@ async def import_manufacturing_data(
             else:
                 result["inserted_count"] += 1
 
-        # Upsert実行
-        response = supabase.table("manufacturing_data").upsert(
-            records_to_upsert,
-            on_conflict="date"
-        ).execute()
+        # Upsert実行（UPSERT_BATCH_SIZE行ずつ）
+        upserted = _upsert_in_batches(
+            supabase, "manufacturing_data", records_to_upsert, on_conflict="date"
+        )
 
-        if response.data:
+        if upserted:
             result["success"] = True
             result["imported_count"] = len(records_to_upsert)
             # 成功時にキャッシュクリア
@@ -5,6 +5,9 @@
 - 財務サマリー（売上原価・販管費の明細展開）
 - 店舗別収支データ
 - 前年比較
+
+レスポンスモデルの値はすべて _to_decimal 等で型変換済みのため、
+検証を省略して model_construct で生成する。
 """
 import asyncio
 from datetime import date
@@ -26,6 +29,17 @@ from app.schemas.financial import (
 )
 
 
+_ZERO = Decimal("0")
+# 前年比・達成率の丸め単位（小数第2位）
+_RATE_QUANTUM = Decimal("0.01")
+
+# 累計で合算する financial_data の列
+_CUMULATIVE_COLUMNS = (
+    "sales_total", "sales_store", "sales_online", "cost_of_sales",
+    "gross_profit", "sg_and_a_total", "operating_profit",
+)
+
+
 # =============================================================================
 # ヘルパー関数
 # =============================================================================
@@ -41,7 +55,7 @@ def _calculate_yoy_rate(
     if current is None or previous is None or previous == 0:
         return None
     result = ((current - previous) / previous) * 100
-    return result.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    return result.quantize(_RATE_QUANTUM, rounding=ROUND_HALF_UP)
 
 
 def _calculate_achievement_rate(
@@ -55,13 +69,17 @@ def _calculate_achievement_rate(
     if actual is None or target is None or target == 0:
         return None
     result = (actual / target) * 100
-    return result.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    return result.quantize(_RATE_QUANTUM, rounding=ROUND_HALF_UP)
 
 
 def _to_decimal(value: Any) -> Optional[Decimal]:
     """値をDecimalに変換する"""
     if value is None:
         return None
+    # integer カラムの値は int で返るため、文字列化を経ずに直接変換する
+    # （numeric は JSON の数値として float で返るので、丸め誤差回避のため str 経由）
+    if type(value) is int:
+        return Decimal(value)
     try:
         return Decimal(str(value))
     except (ValueError, TypeError):
@@ -212,7 +230,7 @@ async def get_cost_of_sales_detail(
             if others < 0:
                 others = Decimal("0")
 
-        return CostOfSalesDetail(
+        return CostOfSalesDetail.model_construct(
             purchases=purchases,
             raw_material_purchases=raw_material,
             labor_cost=labor,
@@ -279,7 +297,7 @@ async def get_sga_detail(
             if others < 0:
                 others = Decimal("0")
 
-        return SGADetail(
+        return SGADetail.model_construct(
             executive_compensation=executive,
             personnel_cost=personnel,
             delivery_cost=delivery,
@@ -338,7 +356,7 @@ async def get_financial_summary_with_details(
             get_sga_detail(supabase, period, sga_total, is_target),
         )
 
-        return FinancialSummaryWithDetails(
+        return FinancialSummaryWithDetails.model_construct(
             period=period,
             sales_total=sales_total,
             sales_store=_to_decimal(row.get("sales_store")),
@@ -400,7 +418,7 @@ async def get_financial_analysis(
 
     if current is None:
         # データがない場合はデフォルト値
-        current = FinancialSummaryWithDetails(period=period)
+        current = FinancialSummaryWithDetails.model_construct(period=period)
 
     # 前年比計算
     sales_yoy = _calculate_yoy_rate(current.sales_total, previous_year.sales_total if previous_year else None)
@@ -412,7 +430,7 @@ async def get_financial_analysis(
     gross_profit_achievement = _calculate_achievement_rate(current.gross_profit, target.gross_profit if target else None)
     operating_profit_achievement = _calculate_achievement_rate(current.operating_profit, target.operating_profit if target else None)
 
-    return FinancialAnalysisResponse(
+    return FinancialAnalysisResponse.model_construct(
         period=period,
         period_type=period_type,
         current=current,
@@ -482,30 +500,25 @@ async def _get_cumulative_financial_summary(
     if not response.data:
         return None
 
-    # 合算
-    total_sales = Decimal("0")
-    total_sales_store = Decimal("0")
-    total_sales_online = Decimal("0")
-    total_cost_of_sales = Decimal("0")
-    total_gross_profit = Decimal("0")
-    total_sga = Decimal("0")
-    total_operating_profit = Decimal("0")
-
-    for row in response.data:
-        total_sales += _to_decimal(row.get("sales_total")) or Decimal("0")
-        total_sales_store += _to_decimal(row.get("sales_store")) or Decimal("0")
-        total_sales_online += _to_decimal(row.get("sales_online")) or Decimal("0")
-        total_cost_of_sales += _to_decimal(row.get("cost_of_sales")) or Decimal("0")
-        total_gross_profit += _to_decimal(row.get("gross_profit")) or Decimal("0")
-        total_sga += _to_decimal(row.get("sg_and_a_total")) or Decimal("0")
-        total_operating_profit += _to_decimal(row.get("operating_profit")) or Decimal("0")
+    # 列ごとに合算
+    totals = {
+        column: sum((_to_decimal(row.get(column)) or _ZERO for row in response.data), _ZERO)
+        for column in _CUMULATIVE_COLUMNS
+    }
+    total_sales = totals["sales_total"]
+    total_sales_store = totals["sales_store"]
+    total_sales_online = totals["sales_online"]
+    total_cost_of_sales = totals["cost_of_sales"]
+    total_gross_profit = totals["gross_profit"]
+    total_sga = totals["sg_and_a_total"]
+    total_operating_profit = totals["operating_profit"]
 
     # 利益率を計算
     gross_profit_rate = (total_gross_profit / total_sales * 100) if total_sales else None
     operating_profit_rate = (total_operating_profit / total_sales * 100) if total_sales else None
 
     # 原価明細・販管費明細は累計では省略（複雑なため）
-    return FinancialSummaryWithDetails(
+    return FinancialSummaryWithDetails.model_construct(
         period=end_period,
         sales_total=total_sales,
         sales_store=total_sales_store,
@@ -547,6 +560,13 @@ async def _get_segments_by_dept(supabase: Client, dept_id: str) -> List[Dict]:
 # 店舗別収支取得
 # =============================================================================
 
+# store_pl の集計対象列
+_STORE_PL_KEYS = ("sales", "cost_of_sales", "gross_profit", "sga_total", "operating_profit")
+# store_pl_sga_details の集計対象列（集計結果では "sga_" を付けて保持する）
+_STORE_PL_SGA_KEYS = ("personnel_cost", "land_rent", "lease_cost", "utilities")
+_STORE_PL_AGG_KEYS = _STORE_PL_KEYS + tuple("sga_" + key for key in _STORE_PL_SGA_KEYS)
+
+
 async def _fetch_store_pl_actual(supabase: Client, period_strings: List[str], segment_ids: List[str]):
     """実績データを取得（販管費明細含む）"""
     return supabase.table("store_pl").select(
@@ -593,12 +613,12 @@ async def get_store_pl_list(
         # 部門IDをキャッシュ付きで取得
         dept_id = await _get_department_id(supabase, department_slug)
         if not dept_id:
-            return StorePLListResponse(period=period, stores=[], period_type=period_type)
+            return StorePLListResponse.model_construct(period=period, stores=[], period_type=period_type)
 
         # 店舗一覧をキャッシュ付きで取得
         segments_data = await _get_segments_by_dept(supabase, dept_id)
         if not segments_data:
-            return StorePLListResponse(period=period, stores=[], period_type=period_type)
+            return StorePLListResponse.model_construct(period=period, stores=[], period_type=period_type)
 
         segment_map = {s["id"]: s for s in segments_data}
         segment_ids = list(segment_map.keys())
@@ -616,52 +636,37 @@ async def get_store_pl_list(
             _fetch_store_pl_prev(supabase, prev_period_strings, segment_ids),
         )
 
-        # セグメントIDごとにデータを集約
+        # セグメントIDごとにデータを集約（行ごとに集計先のdictを1回だけ引く）
         pl_map: Dict[str, Dict[str, Any]] = {}
         for p in (pl_response.data or []):
-            seg_id = p["segment_id"]
-            if seg_id not in pl_map:
-                pl_map[seg_id] = {
-                    "sales": Decimal("0"),
-                    "cost_of_sales": Decimal("0"),
-                    "gross_profit": Decimal("0"),
-                    "sga_total": Decimal("0"),
-                    "operating_profit": Decimal("0"),
-                    "sga_personnel_cost": Decimal("0"),
-                    "sga_land_rent": Decimal("0"),
-                    "sga_lease_cost": Decimal("0"),
-                    "sga_utilities": Decimal("0"),
-                }
-            pl_map[seg_id]["sales"] += _to_decimal(p.get("sales")) or Decimal("0")
-            pl_map[seg_id]["cost_of_sales"] += _to_decimal(p.get("cost_of_sales")) or Decimal("0")
-            pl_map[seg_id]["gross_profit"] += _to_decimal(p.get("gross_profit")) or Decimal("0")
-            pl_map[seg_id]["sga_total"] += _to_decimal(p.get("sga_total")) or Decimal("0")
-            pl_map[seg_id]["operating_profit"] += _to_decimal(p.get("operating_profit")) or Decimal("0")
+            agg = pl_map.get(p["segment_id"])
+            if agg is None:
+                agg = pl_map[p["segment_id"]] = dict.fromkeys(_STORE_PL_AGG_KEYS, _ZERO)
+            for key in _STORE_PL_KEYS:
+                agg[key] += _to_decimal(p.get(key)) or _ZERO
 
             # 販管費明細を集約
             sga_details_list = p.get("store_pl_sga_details", [])
             if sga_details_list:
                 sd = sga_details_list[0] if isinstance(sga_details_list, list) else sga_details_list
-                pl_map[seg_id]["sga_personnel_cost"] += _to_decimal(sd.get("personnel_cost")) or Decimal("0")
-                pl_map[seg_id]["sga_land_rent"] += _to_decimal(sd.get("land_rent")) or Decimal("0")
-                pl_map[seg_id]["sga_lease_cost"] += _to_decimal(sd.get("lease_cost")) or Decimal("0")
-                pl_map[seg_id]["sga_utilities"] += _to_decimal(sd.get("utilities")) or Decimal("0")
+                for key in _STORE_PL_SGA_KEYS:
+                    agg["sga_" + key] += _to_decimal(sd.get(key)) or _ZERO
 
         target_map: Dict[str, Dict[str, Decimal]] = {}
         for p in (target_response.data or []):
-            seg_id = p["segment_id"]
-            if seg_id not in target_map:
-                target_map[seg_id] = {"sales": Decimal("0"), "operating_profit": Decimal("0")}
-            target_map[seg_id]["sales"] += _to_decimal(p.get("sales")) or Decimal("0")
-            target_map[seg_id]["operating_profit"] += _to_decimal(p.get("operating_profit")) or Decimal("0")
+            agg = target_map.get(p["segment_id"])
+            if agg is None:
+                agg = target_map[p["segment_id"]] = {"sales": _ZERO, "operating_profit": _ZERO}
+            agg["sales"] += _to_decimal(p.get("sales")) or _ZERO
+            agg["operating_profit"] += _to_decimal(p.get("operating_profit")) or _ZERO
 
         prev_map: Dict[str, Dict[str, Decimal]] = {}
         for p in (prev_response.data or []):
-            seg_id = p["segment_id"]
-            if seg_id not in prev_map:
-                prev_map[seg_id] = {"sales": Decimal("0"), "operating_profit": Decimal("0")}
-            prev_map[seg_id]["sales"] += _to_decimal(p.get("sales")) or Decimal("0")
-            prev_map[seg_id]["operating_profit"] += _to_decimal(p.get("operating_profit")) or Decimal("0")
+            agg = prev_map.get(p["segment_id"])
+            if agg is None:
+                agg = prev_map[p["segment_id"]] = {"sales": _ZERO, "operating_profit": _ZERO}
+            agg["sales"] += _to_decimal(p.get("sales")) or _ZERO
+            agg["operating_profit"] += _to_decimal(p.get("operating_profit")) or _ZERO
 
         # レスポンス構築
         stores: List[StorePL] = []
@@ -706,7 +711,7 @@ async def get_store_pl_list(
                     detail_total = personnel + land_rent + lease + utilities
                     others = sga - detail_total if sga > detail_total else Decimal("0")
 
-                    sga_detail = StorePLSGADetail(
+                    sga_detail = StorePLSGADetail.model_construct(
                         personnel_cost=personnel,
                         land_rent=land_rent,
                         lease_cost=lease,
@@ -724,7 +729,7 @@ async def get_store_pl_list(
                 sales_achievement = _calculate_achievement_rate(sales, sales_target)
                 op_achievement = _calculate_achievement_rate(op, op_target)
 
-                stores.append(StorePL(
+                stores.append(StorePL.model_construct(
                     store_id=str(segment_id),
                     store_code=segment.get("code"),
                     store_name=segment.get("name", ""),
@@ -756,7 +761,7 @@ async def get_store_pl_list(
                 sales_target = target_data.get("sales") if target_data else None
                 op_target = target_data.get("operating_profit") if target_data else None
 
-                stores.append(StorePL(
+                stores.append(StorePL.model_construct(
                     store_id=str(segment_id),
                     store_code=segment.get("code"),
                     store_name=segment.get("name", ""),
@@ -770,7 +775,7 @@ async def get_store_pl_list(
                     operating_profit_target=op_target,
                 ))
 
-        return StorePLListResponse(
+        return StorePLListResponse.model_construct(
             period=period,
             stores=stores,
             total_sales=total_sales,
@@ -828,7 +833,7 @@ async def get_store_pl_by_segment_id(
         ).eq("is_target", is_target).execute()
 
         if not pl_response.data:
-            return StorePL(
+            return StorePL.model_construct(
                 store_id=str(segment_id),
                 store_code=segment.get("code"),
                 store_name=segment.get("name", ""),
@@ -864,7 +869,7 @@ async def get_store_pl_by_segment_id(
             detail_total = personnel + land_rent + lease + utilities
             others = sga - detail_total if sga > detail_total else Decimal("0")
 
-            sga_detail = StorePLSGADetail(
+            sga_detail = StorePLSGADetail.model_construct(
                 personnel_cost=personnel,
                 land_rent=land_rent,
                 lease_cost=lease,
@@ -878,7 +883,7 @@ async def get_store_pl_by_segment_id(
         sales_yoy = _calculate_yoy_rate(sales, prev_sales)
         op_yoy = _calculate_yoy_rate(op, prev_op)
 
-        return StorePL(
+        return StorePL.model_construct(
             store_id=str(segment_id),
             store_code=segment.get("code"),
             store_name=segment.get("name", ""),
@@ -17,7 +17,7 @@ from uuid import UUID
 
 from supabase import Client
 
-from app.services.cache_service import cache
+from app.services.cache_service import cache, cached
 
 
 # =============================================================================
@@ -645,6 +645,33 @@ async def upsert_kpi_value(
 # ユーティリティ
 # =============================================================================
 
+@cached(prefix="master", ttl=300)
+async def get_department_id_by_slug(
+    supabase: Client,
+    slug: str
+) -> Optional[str]:
+    """
+    部門スラッグから部門IDを取得する（5分キャッシュ）
+
+    部門マスタはほぼ変更されないため、アップロードごとの
+    DB往復を避けるためにキャッシュする。
+
+    Args:
+        supabase: Supabaseクライアント
+        slug: 部門スラッグ（例: "store"）
+
+    Returns:
+        Optional[str]: 部門ID（存在しない場合はNone）
+    """
+    response = supabase.table("departments").select("id").eq(
+        "slug", slug
+    ).execute()
+
+    if not response.data:
+        return None
+    return response.data[0]["id"]
+
+
 async def get_segments_for_department(
     supabase: Client,
     department_id: str
@@ -1459,7 +1459,7 @@ async def get_store_summary(
         for v in values_data:
             seg_id = v["segment_id"]
             kpi_id = v["kpi_id"]
-            val = float(v["value"]) if v["value"] else 0
+            val = float(v["value"]) if v["value"] else 0.0
             v_date = date.fromisoformat(v["date"])
 
             # どの年度に属するか判定
@@ -1475,7 +1475,7 @@ async def get_store_summary(
                 if seg_id not in cumulative_map:
                     cumulative_map[seg_id] = {0: {}, 1: {}, 2: {}}
                 if kpi_id not in cumulative_map[seg_id][year_offset]:
-                    cumulative_map[seg_id][year_offset][kpi_id] = 0
+                    cumulative_map[seg_id][year_offset][kpi_id] = 0.0
                 cumulative_map[seg_id][year_offset][kpi_id] += val
 
         # 店舗別データを構築
@@ -1586,13 +1586,13 @@ async def get_store_summary(
         for v in current_response.data:
             if v["segment_id"] not in current_map:
                 current_map[v["segment_id"]] = {}
-            current_map[v["segment_id"]][v["kpi_id"]] = float(v["value"]) if v["value"] else 0
+            current_map[v["segment_id"]][v["kpi_id"]] = float(v["value"]) if v["value"] else 0.0
 
         prev_map: Dict[str, Dict[str, float]] = {}
         for v in prev_response.data:
             if v["segment_id"] not in prev_map:
                 prev_map[v["segment_id"]] = {}
-            prev_map[v["segment_id"]][v["kpi_id"]] = float(v["value"]) if v["value"] else 0
+            prev_map[v["segment_id"]][v["kpi_id"]] = float(v["value"]) if v["value"] else 0.0
 
         # 店舗別データを構築
         stores = []
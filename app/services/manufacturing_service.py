@@ -3,6 +3,9 @@
 
 製造部門のデータ取得・分析を行うサービス。
 製造量、出勤者数、1人あたり製造量、有給取得状況を管理する。
+
+レスポンスモデルはサービス内で型変換済みの値から生成するため、
+検証を省略して model_construct で生成する。
 """
 from datetime import date
 from decimal import Decimal, ROUND_HALF_UP
@@ -74,7 +77,7 @@ async def get_manufacturing_analysis(
     # グラフ用データを取得
     chart_data = await get_chart_data(supabase, months=12)
 
-    return ManufacturingAnalysisResponse(
+    return ManufacturingAnalysisResponse.model_construct(
         period=period_label,
         period_type=period_type,
         summary=summary,
@@ -142,13 +145,13 @@ async def get_monthly_summary(
             Decimal(str(total_batts)) / Decimal(str(total_workers))
         ).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
 
-    return ManufacturingMonthlySummary(
+    return ManufacturingMonthlySummary.model_construct(
         month=start_date.strftime("%Y-%m"),
         total_batts=total_batts,
         total_pieces=total_pieces,
         total_workers=total_workers,
-        avg_production_per_worker=avg_production,
-        total_paid_leave_hours=total_paid_leave,
+        avg_production_per_worker=float(avg_production) if avg_production is not None else None,
+        total_paid_leave_hours=float(total_paid_leave),
         working_days=working_days,
     )
 
@@ -199,13 +202,13 @@ async def get_daily_data(
             if batts and workers > 0 and not per_worker:
                 per_worker = round(batts / workers, 2)
 
-            daily_data.append(ManufacturingDailySummary(
+            daily_data.append(ManufacturingDailySummary.model_construct(
                 date=date.fromisoformat(row["date"]),
                 production_batts=batts,
                 production_pieces=pieces,
                 workers_count=workers if workers > 0 else None,
-                production_per_worker=Decimal(str(per_worker)) if per_worker else None,
-                paid_leave_hours=Decimal(str(row.get("paid_leave_hours") or 0)),
+                production_per_worker=float(per_worker) if per_worker else None,
+                paid_leave_hours=float(row.get("paid_leave_hours") or 0),
             ))
 
     return daily_data
@@ -259,17 +262,18 @@ async def get_comparison_data(
 
     if current.avg_production_per_worker and previous_year.avg_production_per_worker:
         yoy_productivity_diff = (
-            current.avg_production_per_worker - previous_year.avg_production_per_worker
+            Decimal(str(current.avg_production_per_worker))
+            - Decimal(str(previous_year.avg_production_per_worker))
         ).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
 
-    return ManufacturingComparison(
+    return ManufacturingComparison.model_construct(
         period=period_label,
         current=current,
         previous_year=previous_year if previous_year.total_batts > 0 else None,
         previous_year2=previous_year2 if previous_year2.total_batts > 0 else None,
         yoy_batts_diff=yoy_batts_diff,
-        yoy_batts_rate=yoy_batts_rate,
-        yoy_productivity_diff=yoy_productivity_diff,
+        yoy_batts_rate=float(yoy_batts_rate) if yoy_batts_rate is not None else None,
+        yoy_productivity_diff=float(yoy_productivity_diff) if yoy_productivity_diff is not None else None,
     )
 
 
@@ -324,7 +328,7 @@ async def get_chart_data(
         # 月次サマリーを取得
         summary = await get_monthly_summary(supabase, target_month, end_of_month)
 
-        chart_data.append(ManufacturingChartData(
+        chart_data.append(ManufacturingChartData.model_construct(
             month=target_month.strftime("%Y-%m"),
             total_batts=summary.total_batts,
             avg_production_per_worker=summary.avg_production_per_worker,
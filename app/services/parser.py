@@ -235,7 +235,8 @@ def parse_store_csv(file_content: bytes, filename: str = "") -> Dict[str, Any]:
             return result
 
         # データ行のパース
-        for idx, row in df.iterrows():
+        # iterrowsは行ごとにSeriesを生成して遅いため、素のdictで走査する
+        for idx, row in zip(df.index, df.to_dict("records")):
             row_num = idx + 4  # 期間行 + メタ行 + ヘッダー行 + 0始まりインデックス
 
             try:
@@ -420,7 +421,8 @@ def parse_product_csv(file_content: bytes, filename: str = "") -> Dict[str, Any]
                     break
 
         # データ行のパース
-        for idx, row in df.iterrows():
+        # iterrowsは行ごとにSeriesを生成して遅いため、素のdictで走査する
+        for idx, row in zip(df.index, df.to_dict("records")):
             row_num = idx + 4  # 期間行 + メタ行 + ヘッダー行 + 0始まりインデックス
 
             try:
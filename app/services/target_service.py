@@ -10,8 +10,13 @@ from typing import Dict, Any, List, Optional
 
 from supabase import Client
 
+from app.services.cache_service import cache
 from app.services.metrics import get_fiscal_year, normalize_to_month_start, get_previous_year_month
 from app.schemas.target import (
+    StoreTargetKPI,
+    StoreTargetMatrix,
+    StoreTargetRow,
+    StoreTargetValue,
     FinancialTargetResponse,
     FinancialTargetItem,
     FinancialTargetInput,
@@ -252,6 +257,32 @@ async def get_target_values(
     return result
 
 
+def _get_target_matrix_metadata(supabase: Client, department_id: str):
+    """
+    目標マトリックスに必要なメタデータ（セグメント・KPI定義）を取得する。
+    1時間TTLでキャッシュし、変動しないマスタデータのDB問い合わせを削減。
+    """
+    key = f"meta:target_matrix:{department_id}"
+    cached_value = cache.get(key)
+    if cached_value is not None:
+        return cached_value
+
+    segments_response = supabase.table("segments").select(
+        "id, code, name"
+    ).eq("department_id", department_id).order("code").execute()
+
+    # KPI定義（全体カテゴリのみ＝売上高、客数など主要KPI）
+    kpis_response = supabase.table("kpi_definitions").select(
+        "id, name, unit, category"
+    ).eq("department_id", department_id).eq(
+        "is_visible", True
+    ).in_("category", ["全体"]).order("display_order").execute()
+
+    result = (segments_response.data, kpis_response.data)
+    cache.set(key, result, ttl=3600)
+    return result
+
+
 async def get_target_matrix(
     supabase: Client,
     department_id: str,
@@ -276,11 +307,8 @@ async def get_target_matrix(
     previous_month = get_previous_year_month(month)
 
 
-    # セグメントを取得
-    segments_response = supabase.table("segments").select(
-        "id, code, name"
-    ).eq("department_id", department_id).order("code").execute()
-    segments = segments_response.data
+    # セグメント・KPI定義をキャッシュから取得（1時間TTL、初回以降はDB問い合わせなし）
+    segments, kpis = _get_target_matrix_metadata(supabase, department_id)
 
     if not segments:
         return {
@@ -290,14 +318,6 @@ async def get_target_matrix(
             "rows": [],
         }
 
-    # KPI定義を取得（全体カテゴリのみ＝売上高、客数など主要KPI）
-    kpis_response = supabase.table("kpi_definitions").select(
-        "id, name, unit, category"
-    ).eq("department_id", department_id).eq(
-        "is_visible", True
-    ).in_("category", ["全体"]).order("display_order").execute()
-    kpis = kpis_response.data
-
     if not kpis:
         return {
             "fiscal_year": fiscal_year,
@@ -378,6 +398,47 @@ async def get_target_matrix(
     }
 
 
+async def get_store_target_matrix(
+    supabase: Client,
+    department_id: str,
+    month: date
+) -> StoreTargetMatrix:
+    """
+    店舗目標マトリックスをレスポンスモデルとして取得する
+
+    get_target_matrix の結果の目標値・前年実績をDecimalに変換し、
+    店舗数×KPI数の検証を避けるため model_construct で生成する。
+
+    Args:
+        supabase: Supabaseクライアント
+        department_id: 部門ID
+        month: 対象月
+
+    Returns:
+        StoreTargetMatrix: 店舗目標マトリックス
+    """
+    result = await get_target_matrix(supabase, department_id, month)
+    return StoreTargetMatrix.model_construct(**{
+        **result,
+        "kpis": [StoreTargetKPI.model_construct(**kpi) for kpi in result["kpis"]],
+        "rows": [
+            StoreTargetRow.model_construct(**{
+                **row,
+                "values": {
+                    kpi_id: StoreTargetValue.model_construct(
+                        kpi_id=cell["kpi_id"],
+                        target_id=cell["target_id"],
+                        value=_to_decimal(cell["value"]),
+                        last_year_actual=_to_decimal(cell["last_year_actual"]),
+                    )
+                    for kpi_id, cell in row["values"].items()
+                },
+            })
+            for row in result["rows"]
+        ],
+    })
+
+
 # =============================================================================
 # ヘルパー関数
 # =============================================================================
@@ -482,7 +543,7 @@ async def get_financial_targets(
     for db_field, api_field, name in summary_fields:
         target_val = _to_decimal(target_data.get(db_field))
         actual_val = _to_decimal(actual_data.get(db_field))
-        summary_items.append(FinancialTargetItem(
+        summary_items.append(FinancialTargetItem.model_construct(
             field_name=api_field,
             display_name=name,
             target_value=target_val,
@@ -506,7 +567,7 @@ async def get_financial_targets(
     for field, name in cost_fields:
         target_val = _to_decimal(cost_target.get(field))
         actual_val = _to_decimal(cost_actual.get(field))
-        cost_items.append(FinancialTargetItem(
+        cost_items.append(FinancialTargetItem.model_construct(
             field_name=field,
             display_name=name,
             target_value=target_val,
@@ -531,7 +592,7 @@ async def get_financial_targets(
     for field, name in sga_fields:
         target_val = _to_decimal(sga_target.get(field))
         actual_val = _to_decimal(sga_actual.get(field))
-        sga_items.append(FinancialTargetItem(
+        sga_items.append(FinancialTargetItem.model_construct(
             field_name=field,
             display_name=name,
             target_value=target_val,
@@ -540,7 +601,8 @@ async def get_financial_targets(
             yoy_rate=_calculate_yoy_rate(target_val, actual_val),
         ))
 
-    return FinancialTargetResponse(
+    # 値はすべて_to_decimal等で型変換済みのため、検証なしで生成する
+    return FinancialTargetResponse.model_construct(
         fiscal_year=fiscal_year,
         month=month.isoformat(),
         summary_items=summary_items,
@@ -704,7 +766,7 @@ async def get_ecommerce_targets(
         if actual_sales:
             total_actual_sales += actual_sales
 
-        channel_targets.append(EcommerceChannelTarget(
+        channel_targets.append(EcommerceChannelTarget.model_construct(
             channel=channel,
             target_sales=target_sales,
             target_buyers=target_buyers,
@@ -723,7 +785,7 @@ async def get_ecommerce_targets(
     for ch in default_channels:
         if ch not in existing_channels:
             actual = channel_actuals.get(ch, {})
-            channel_targets.append(EcommerceChannelTarget(
+            channel_targets.append(EcommerceChannelTarget.model_construct(
                 channel=ch,
                 target_sales=None,
                 target_buyers=None,
@@ -755,7 +817,7 @@ async def get_ecommerce_targets(
         actual_new = customer_actual.get("new_customers")
         actual_repeat = customer_actual.get("repeat_customers")
 
-        customer_target_obj = EcommerceCustomerTarget(
+        customer_target_obj = EcommerceCustomerTarget.model_construct(
             new_customers=target_new,
             repeat_customers=target_repeat,
             last_year_new=actual_new,
@@ -770,7 +832,8 @@ async def get_ecommerce_targets(
             ),
         )
 
-    return EcommerceTargetResponse(
+    # 値はすべて型変換済み（購入者数・顧客数はINTEGER列）のため、検証なしで生成する
+    return EcommerceTargetResponse.model_construct(
         fiscal_year=fiscal_year,
         month=month.isoformat(),
         total_target_sales=total_target_sales if total_target_sales > 0 else None,
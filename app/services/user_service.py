@@ -13,7 +13,6 @@ from app.schemas.user import (
     UserProfileUpdate,
     UserProfileResponse,
     UserListResponse,
-    UserRoleInfo,
     UserRoleListResponse,
     UserOperationResult,
     CurrentUserResponse,
@@ -37,14 +36,24 @@ async def is_admin(supabase: Client, user_id: str) -> bool:
     Returns:
         bool: 管理者の場合True
     """
+    # 管理画面は複数APIを同時に呼ぶため、判定結果を短時間キャッシュする
+    # （ロール変更・無効化時は update_user / deactivate_user で破棄）
+    cache_key = f"user:is_admin:{user_id}"
+    cached_result = cache.get(cache_key)
+    if cached_result is not None:
+        return cached_result
+
     try:
         response = supabase.table("user_profiles").select("role").eq(
             "id", user_id
         ).execute()
 
         if response.data and len(response.data) > 0:
-            return response.data[0].get("role") == "admin"
-        return False
+            result = response.data[0].get("role") == "admin"
+        else:
+            result = False
+        cache.set(cache_key, result, ttl=60)
+        return result
     except Exception:
         return False
 
@@ -193,21 +202,23 @@ async def get_user_list(supabase: Client) -> UserListResponse:
         roles_response = supabase.table("user_roles").select("code, name").execute()
         role_map = {r["code"]: r["name"] for r in roles_response.data} if roles_response.data else {}
 
-        users = []
-        for user in response.data or []:
-            users.append(UserProfileResponse(
-                id=user["id"],
-                email=user["email"],
-                display_name=user.get("display_name"),
-                role=user["role"],
-                role_name=role_map.get(user["role"], user["role"]),
-                is_active=user.get("is_active", True),
-                created_at=user.get("created_at"),
-                updated_at=user.get("updated_at"),
-                last_sign_in_at=None,  # auth.usersからは取得しない（RLS制限）
-            ))
-
-        return UserListResponse(users=users, total=len(users))
+        users = [
+            {
+                "id": user["id"],
+                "email": user["email"],
+                "display_name": user.get("display_name"),
+                "role": user["role"],
+                "role_name": role_map.get(user["role"], user["role"]),
+                "is_active": user.get("is_active", True),
+                "created_at": user.get("created_at"),
+                "updated_at": user.get("updated_at"),
+                "last_sign_in_at": None,  # auth.usersからは取得しない（RLS制限）
+            }
+            for user in response.data or []
+        ]
+
+        # 1件ずつモデルを生成せず、一覧全体を1回のバリデーションで構築する
+        return UserListResponse.model_validate({"users": users, "total": len(users)})
     except Exception as e:
         raise Exception(f"ユーザー一覧の取得に失敗しました: {str(e)}")
 
@@ -386,6 +397,7 @@ async def update_user(
 
         # プロファイルキャッシュを無効化（is_active 等の即時反映のため）
         cache.delete(f"user:profile:{user_id}")
+        cache.delete(f"user:is_admin:{user_id}")
         try:
             from app.api.deps import invalidate_active_flag_cache
 
@@ -476,15 +488,16 @@ async def get_roles(supabase: Client) -> UserRoleListResponse:
         ).order("display_order").execute()
 
         roles = [
-            UserRoleInfo(
-                code=r["code"],
-                name=r["name"],
-                description=r.get("description"),
-            )
+            {
+                "code": r["code"],
+                "name": r["name"],
+                "description": r.get("description"),
+            }
             for r in response.data or []
         ]
 
-        return UserRoleListResponse(roles=roles)
+        # 1件ずつモデルを生成せず、一覧全体を1回のバリデーションで構築する
+        return UserRoleListResponse.model_validate({"roles": roles})
 
     except Exception as e:
         raise Exception(f"権限一覧の取得に失敗しました: {str(e)}")
@@ -535,6 +548,7 @@ async def deactivate_user(
 
         # キャッシュ無効化（無効化を即時反映するため）
         cache.delete(f"user:profile:{user_id}")
+        cache.delete(f"user:is_admin:{user_id}")
         try:
             from app.api.deps import invalidate_active_flag_cache
 